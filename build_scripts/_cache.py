@@ -0,0 +1,146 @@
+"""
+Content-addressable cache for PyInstaller build outputs
+
+A build is keyed by the SHA-256 of the application sources, requirements,
+the PyInstaller arguments and the toolchain (Python, PyInstaller, installed
+dependency versions and the effective app version). When nothing relevant
+changed, the previous artifact is copied back into dist/ instead of running
+PyInstaller again.
+"""
+
+import hashlib
+import platform
+import re
+import shutil
+import sys
+from importlib import metadata
+from pathlib import Path
+
+from _common import PROJECT_ROOT, get_version
+
+APP_SRC_DIR = PROJECT_ROOT / "src" / "trackerspotter"
+
+
+def source_files(extra_files=()):
+    """
+    List the files whose content determines the build output
+
+    Args:
+        extra_files: Additional inputs (e.g. the icon) to include
+
+    Returns:
+        List of file paths
+    """
+    files = [PROJECT_ROOT / "trackerspotter.py", PROJECT_ROOT / "requirements.txt"]
+    files += [
+        path for path in APP_SRC_DIR.rglob("*")
+        if path.is_file() and "__pycache__" not in path.parts
+    ]
+    files += [Path(path) for path in extra_files if path]
+    return files
+
+
+# Packages that shape the build without a pin in requirements.txt: the
+# PyInstaller toolchain and optional dependencies bundled when installed
+TOOLCHAIN_PACKAGES = (
+    "pyinstaller", "pyinstaller-hooks-contrib", "pefile", "macholib", "better_bencode",
+    "orjson",
+)
+
+
+def _requirement_names():
+    """Distribution names listed in requirements.txt"""
+    names = []
+    for line in (PROJECT_ROOT / "requirements.txt").read_text(encoding="utf-8").splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line and not line.startswith("-"):
+            names.append(re.split(r"[<>=!~;\[ ]", line, maxsplit=1)[0])
+    return names
+
+
+def build_environment():
+    """
+    Describe the toolchain and dependencies that shape a build
+
+    Returns:
+        String with the Python build, platform, package versions and the
+        effective app version (including a TRACKERSPOTTER_VERSION override)
+    """
+    parts = [sys.version, sys.implementation.cache_tag, platform.machine(), get_version()]
+    for name in (*TOOLCHAIN_PACKAGES, *_requirement_names()):
+        try:
+            parts.append(f"{name}=={metadata.version(name)}")
+        except metadata.PackageNotFoundError:
+            parts.append(f"{name} missing")
+    return "\n".join(parts)
+
+
+def fingerprint(paths, extra):
+    """
+    Hash file contents, an extra string (the PyInstaller arguments) and the
+    build environment
+
+    Args:
+        paths: Files to hash
+        extra: Extra data that affects the build
+
+    Returns:
+        Hex digest
+    """
+    h = hashlib.sha256()
+    for path in sorted(paths):
+        h.update(str(path).encode("utf-8"))
+        h.update(path.read_bytes())
+    h.update(extra.encode("utf-8"))
+    h.update(build_environment().encode("utf-8"))
+    return h.hexdigest()
+
+
+def _copy(src, dst):
+    """Copy a file or directory artifact, replacing any existing one"""
+    if dst.is_dir():
+        shutil.rmtree(dst)
+    elif dst.exists():
+        dst.unlink()
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    if src.is_dir():
+        shutil.copytree(src, dst, symlinks=True, copy_function=shutil.copy)
+    else:
+        shutil.copy(src, dst)
+
+
+def restore(cache_dir, digest, artifact):
+    """
+    Copy a cached artifact back into place
+
+    Args:
+        cache_dir: Cache directory for this artifact
+        digest: Build fingerprint
+        artifact: Path where the build output is expected
+
+    Returns:
+        True if the artifact was restored from cache
+    """
+    cached = cache_dir / digest / artifact.name
+    if not cached.exists():
+        return False
+    _copy(cached, artifact)
+    return True
+
+
+def store(cache_dir, digest, artifact):
+    """
+    Save a fresh build output, keeping only the latest entry
+
+    Args:
+        cache_dir: Cache directory for this artifact
+        digest: Build fingerprint
+        artifact: Path of the build output
+    """
+    if not artifact.exists():
+        return
+    if cache_dir.exists():
+        for entry in cache_dir.iterdir():
+            if entry.name != digest:
+                shutil.rmtree(entry, ignore_errors=True)
+    _copy(artifact, cache_dir / digest / artifact.name)
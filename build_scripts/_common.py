@@ -0,0 +1,84 @@
+"""
+Shared helpers for the build scripts
+"""
+
+import os
+import re
+import shutil
+import subprocess
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+INIT_FILE = PROJECT_ROOT / "src" / "trackerspotter" / "__init__.py"
+_VERSION_RE = re.compile(r'''__version__\s*=\s*["']([^"']+)["']''')
+
+
+@lru_cache(maxsize=1)
+def get_version():
+    """
+    Read version from __init__.py (single source of truth), once per process
+
+    TRACKERSPOTTER_VERSION overrides the file, e.g. for CI release builds.
+    """
+    override = os.environ.get("TRACKERSPOTTER_VERSION")
+    if override:
+        return override
+    # __version__ sits near the top, so try the first KB before reading it all
+    with INIT_FILE.open("rb") as f:
+        head = f.read(1024).decode("utf-8", "replace")
+    match = _VERSION_RE.search(head) or _VERSION_RE.search(INIT_FILE.read_text(encoding="utf-8"))
+    return match.group(1) if match else "0.0.0"
+
+
+def remove_tree(path):
+    """
+    Delete a directory tree
+
+    Shells out to the native tool (rm -rf on Linux/macOS, rd /s /q on
+    Windows), which removes a large PyInstaller work directory far faster than
+    shutil.rmtree's per-entry Python calls. Falls back to shutil.rmtree if the
+    tool is unavailable or leaves anything behind.
+    """
+    if sys.platform in ('linux', 'darwin'):
+        command = ['rm', '-rf', str(path)]
+    elif sys.platform == 'win32':
+        command = ['cmd', '/c', 'rd', '/s', '/q', str(path)]
+    else:
+        command = None
+
+    if command:
+        try:
+            subprocess.run(command, check=False)
+        except FileNotFoundError:
+            pass
+        # Anything left (e.g. locked files) is retried, and reported, by shutil
+        if not os.path.exists(path):
+            return
+    shutil.rmtree(path)
+
+
+def render_spec(template, dest, **values):
+    """
+    Fill a checked-in .spec template and write it next to the build output
+
+    Each keyword replaces the matching __KEY__ placeholder with its Python
+    literal. The file is only rewritten when the content changes, so
+    PyInstaller sees a stable spec between identical builds.
+
+    Args:
+        template: Path of the spec template under build_scripts/specs/
+        dest: Path of the rendered spec
+        **values: Placeholder values
+
+    Returns:
+        Path of the rendered spec
+    """
+    text = template.read_text(encoding="utf-8")
+    for key, value in values.items():
+        text = text.replace(f"__{key.upper()}__", repr(value))
+    if not dest.exists() or dest.read_text(encoding="utf-8") != text:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_text(text, encoding="utf-8")
+    return dest
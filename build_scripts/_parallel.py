@@ -0,0 +1,37 @@
+"""
+Size-aware parallel map for the build scripts
+
+Pools only pay off when there is enough work to amortise their startup (and,
+for processes, the pickling of every argument). Small inputs run serially;
+set TS_SERIAL=1 to force serial execution everywhere, e.g. when debugging.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+
+def map_maybe_parallel(fn, items, min_for_pool=8, max_workers=None,
+                       threads=False, chunksize=1):
+    """
+    Apply fn to every item, in a pool only when the input is large enough
+
+    Args:
+        fn: Function of one argument (module-level when using processes)
+        items: Sequence of inputs
+        min_for_pool: Below this many items, run serially
+        max_workers: Pool size (default: CPU count)
+        threads: Use a thread pool instead of processes (for I/O-bound work)
+        chunksize: Items sent to a worker process at a time
+
+    Returns:
+        List of results, in input order
+    """
+    items = list(items)
+    if len(items) < min_for_pool or os.environ.get('TS_SERIAL'):
+        return [fn(item) for item in items]
+
+    if threads:
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as ex:
+            return list(ex.map(fn, items))
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as ex:
+        return list(ex.map(fn, items, chunksize=chunksize))
@@ -0,0 +1,102 @@
+"""
+Build script for running several platform builds in parallel
+
+Each target gets a dedicated build/<target> and dist/<target> tree, and
+several targets run in separate processes, so PyInstaller invocations never
+share a work directory.
+
+Usage:
+    python build_scripts/build_all.py                 # Targets for this platform
+    python build_scripts/build_all.py linux console   # Explicit targets
+"""
+
+import importlib
+import os
+import sys
+
+from _parallel import map_maybe_parallel
+
+# Target name -> (build module, entry point)
+TARGETS = {
+    "linux": ("build_linux", "main"),
+    "macos": ("build_macos", "main"),
+    "windows": ("build_windows", "main"),
+    "console": ("build_console", "build_console_exe"),
+}
+
+# Targets that can actually be built on each host platform
+PLATFORM_TARGETS = {
+    "linux": ["linux"],
+    "darwin": ["macos"],
+    "win32": ["windows", "console"],
+}
+
+
+def run_target(target: str) -> int:
+    """
+    Run a single platform build in the current (worker) process
+
+    Args:
+        target: Key in TARGETS
+
+    Returns:
+        Process-style exit code (0 on success)
+    """
+    module_name, entry_point = TARGETS[target]
+
+    # Build paths are resolved at import time, so set the subdir first and make
+    # sure a reused worker does not keep a module imported for another target
+    os.environ["TS_BUILD_SUBDIR"] = target
+    sys.modules.pop(module_name, None)
+    module = importlib.import_module(module_name)
+
+    try:
+        result = getattr(module, entry_point)()
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    return 1 if result is False else 0
+
+
+def _run_target_safely(target: str) -> int:
+    """Run a target, reporting a crash as a failed build instead of raising"""
+    try:
+        return run_target(target)
+    except Exception as e:
+        print(f"\n[ERROR] {target} build crashed: {e}")
+        return 1
+
+
+def main():
+    """Run the requested builds in parallel"""
+    targets = sys.argv[1:] or PLATFORM_TARGETS.get(sys.platform, ["linux"])
+
+    unknown = [t for t in targets if t not in TARGETS]
+    if unknown:
+        print(f"[ERROR] Unknown target(s): {', '.join(unknown)}")
+        print(f"Available targets: {', '.join(TARGETS)}")
+        sys.exit(1)
+
+    print(f"Building targets in parallel: {', '.join(targets)}")
+
+    # A single target runs in-process; TS_SERIAL=1 forces one at a time
+    codes = map_maybe_parallel(
+        _run_target_safely,
+        targets,
+        min_for_pool=2,
+        max_workers=min(len(targets), os.cpu_count() or 1),
+    )
+
+    failed = []
+    for target, code in zip(targets, codes):
+        if code == 0:
+            print(f"\n[OK] {target} build finished (dist/{target}/)")
+        else:
+            print(f"\n[ERROR] {target} build failed (exit code {code})")
+            failed.append(target)
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -6,51 +6,63 @@ Useful for debugging
 import os
 import sys
 from pathlib import Path
-import PyInstaller.__main__
+
+from _cache import fingerprint, restore, source_files, store
+from _common import render_spec
 
 PROJECT_ROOT = Path(__file__).parent.parent
 SRC_DIR = PROJECT_ROOT / "src"
-DIST_DIR = PROJECT_ROOT / "dist"
-BUILD_DIR = PROJECT_ROOT / "build"
+# TS_BUILD_SUBDIR gives each platform its own work/dist tree (see build_all.py)
+BUILD_SUBDIR = os.environ.get("TS_BUILD_SUBDIR", "")
+DIST_DIR = PROJECT_ROOT / "dist" / BUILD_SUBDIR
+BUILD_DIR = PROJECT_ROOT / "build" / BUILD_SUBDIR
 STATIC_DIR = SRC_DIR / "trackerspotter" / "static"
+SPEC_TEMPLATE = Path(__file__).parent / "specs" / "console.spec"
 
 
-def build_console_exe():
-    """Build console version for debugging"""
+def build_console_exe(fresh: bool = False):
+    """
+    Build console version for debugging
+    
+    Args:
+        fresh: Discard the build cache and PyInstaller's cache and rebuild from scratch
+    """
     print("Building TrackerSpotter (Console Version)...")
     
+    # Hidden imports, data files and the single-file layout live in specs/console.spec
     args = [
-        str(PROJECT_ROOT / "trackerspotter.py"),
-        "--name", "TrackerSpotter_Console",
-        "--onefile",
-        "--console",  # Keep console window visible
-        "--clean",
+        str(BUILD_DIR / SPEC_TEMPLATE.name),
+        "--noconfirm",
         f"--distpath={DIST_DIR}",
         f"--workpath={BUILD_DIR}",
-        f"--add-data={STATIC_DIR}{os.pathsep}trackerspotter/static",
-        
-        # Core dependencies
-        "--hidden-import=flask",
-        "--hidden-import=bencodepy",
-        
-        # Flask-SocketIO and dependencies
-        "--hidden-import=flask_socketio",
-        "--hidden-import=socketio",
-        "--hidden-import=socketio.server",
-        "--hidden-import=engineio",
-        "--hidden-import=engineio.server",
-        "--hidden-import=engineio.async_drivers.threading",
-        
-        # WebSocket support
-        "--hidden-import=simple_websocket",
-        "--hidden-import=wsproto",
-        "--hidden-import=wsproto.connection",
-        "--hidden-import=wsproto.events",
-        "--hidden-import=h11",
     ]
     
+    if fresh:
+        args.append("--clean")
+    
+    # Reuse the previous output when sources, requirements and args are unchanged
+    artifact = DIST_DIR / "TrackerSpotter_Console.exe"
+    cache_dir = BUILD_DIR / ".build-cache" / artifact.name
+    digest = fingerprint(source_files([SPEC_TEMPLATE]), " ".join(args))
+    if not fresh and restore(cache_dir, digest, artifact):
+        print(f"\n[OK] Sources unchanged, reused cached build ({digest[:12]})")
+        print(f"Executable: {artifact}")
+        return True
+    
+    render_spec(
+        SPEC_TEMPLATE,
+        BUILD_DIR / SPEC_TEMPLATE.name,
+        project_root=str(PROJECT_ROOT),
+        static_dir=str(STATIC_DIR),
+    )
+    
+    # Imported here so --help, version lookups and failed dependency
+    # checks don't pay for loading PyInstaller
+    import PyInstaller.__main__
+    
     try:
         PyInstaller.__main__.run(args)
+        store(cache_dir, digest, artifact)
         print(f"\n[SUCCESS] Console build successful!")
         print(f"Executable: {DIST_DIR / 'TrackerSpotter_Console.exe'}")
         print(f"\nNote: This version shows the console for debugging")
@@ -61,5 +73,5 @@ def build_console_exe():
 
 
 if __name__ == '__main__':
-    build_console_exe()
+    build_console_exe(fresh="--fresh" in sys.argv)
 
@@ -4,43 +4,62 @@ Build script for creating Linux executable using PyInstaller
 
 import os
 import sys
-import re
 import shutil
+import subprocess
+import tarfile
+import time
+from io import BytesIO
 from pathlib import Path
-import PyInstaller.__main__
+
+from _common import get_version, remove_tree, render_spec
+from _cache import fingerprint, restore, source_files, store
+from _parallel import map_maybe_parallel
 
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent
 SRC_DIR = PROJECT_ROOT / "src"
-DIST_DIR = PROJECT_ROOT / "dist"
-BUILD_DIR = PROJECT_ROOT / "build"
+# TS_BUILD_SUBDIR gives each platform its own work/dist tree (see build_all.py)
+BUILD_SUBDIR = os.environ.get("TS_BUILD_SUBDIR", "")
+DIST_DIR = PROJECT_ROOT / "dist" / BUILD_SUBDIR
+BUILD_DIR = PROJECT_ROOT / "build" / BUILD_SUBDIR
 STATIC_DIR = SRC_DIR / "trackerspotter" / "static"
 ICONS_DIR = PROJECT_ROOT / "icons"
-
-
-def get_version():
-    """Read version from __init__.py (single source of truth)"""
-    init_file = SRC_DIR / "trackerspotter" / "__init__.py"
-    content = init_file.read_text(encoding="utf-8")
-    match = re.search(r'__version__\s*=\s*["\']([^"\']+)["\']', content)
-    return match.group(1) if match else "0.0.0"
+SPEC_TEMPLATE = Path(__file__).parent / "specs" / "linux.spec"
 
 
 # Build configuration
 APP_NAME = "TrackerSpotter"
 APP_NAME_LOWER = "trackerspotter"
 VERSION = get_version()
-ICON_FILE = ICONS_DIR / "trackerspotter.png" if (ICONS_DIR / "trackerspotter.png").exists() else None
-
-
-def clean_build_directories():
-    """Clean previous build artifacts"""
+ARCHIVE_FORMATS = {"gztar": "tar.gz", "zip": "ZIP"}
+_icon = ICONS_DIR / "trackerspotter.png"
+ICON_FILE = _icon if _icon.is_file() else None
+
+# CI detection, read once at import (GitHub Actions sets GITHUB_ACTIONS, RUNNER_OS, etc.)
+_CI_ENV = {
+    var: os.environ[var]
+    for var in ('CI', 'GITHUB_ACTIONS', 'GITHUB_WORKFLOW', 'RUNNER_OS')
+    if os.environ.get(var)
+}
+IS_CI = bool(_CI_ENV)
+IS_LINUX = sys.platform == 'linux'
+
+
+def clean_build_directories(fresh: bool = False):
+    """
+    Clean previous build artifacts
+    
+    Args:
+        fresh: Also remove the PyInstaller work directory (forces a full rebuild)
+    """
     print("Cleaning build directories...")
     
-    for directory in [DIST_DIR, BUILD_DIR]:
+    # Keep BUILD_DIR by default so PyInstaller can reuse its cached analysis
+    directories = [DIST_DIR, BUILD_DIR] if fresh else [DIST_DIR]
+    for directory in directories:
         if directory.exists():
             try:
-                shutil.rmtree(directory)
+                remove_tree(directory)
                 print(f"   Removed: {directory}")
             except PermissionError as e:
                 print(f"   [WARNING] Could not remove {directory}: {e}")
@@ -57,61 +76,55 @@ def clean_build_directories():
             print(f"   [WARNING] Could not remove {spec_file}: {e}")
 
 
-def build_executable():
-    """Build the Linux executable using PyInstaller"""
+def build_executable(fresh: bool = False):
+    """
+    Build the Linux executable using PyInstaller
+    
+    Args:
+        fresh: Ignore the build cache and always run PyInstaller
+    """
     print(f"\nBuilding {APP_NAME} v{VERSION} for Linux...")
     
-    # PyInstaller arguments for Linux
+    # Hidden imports, data files and bundle layout live in specs/linux.spec
     args = [
-        str(PROJECT_ROOT / "trackerspotter.py"),  # Entry point
-        "--name", APP_NAME_LOWER,  # Lowercase for Linux conventions
-        "--onefile",  # Single executable
-        "--console",  # Keep console for Linux (terminal app)
-        "--clean",
+        str(BUILD_DIR / SPEC_TEMPLATE.name),
+        "--noconfirm",
         f"--distpath={DIST_DIR}",
         f"--workpath={BUILD_DIR}",
-        
-        # Add data files (static folder) - Linux uses : as separator
-        f"--add-data={STATIC_DIR}:trackerspotter/static",
-        
-        # Core dependencies
-        "--hidden-import=flask",
-        "--hidden-import=bencodepy",
-        
-        # Flask-SocketIO and dependencies
-        "--hidden-import=flask_socketio",
-        "--hidden-import=socketio",
-        "--hidden-import=socketio.server",
-        "--hidden-import=engineio",
-        "--hidden-import=engineio.server",
-        "--hidden-import=engineio.async_drivers.threading",
-        
-        # WebSocket support
-        "--hidden-import=simple_websocket",
-        "--hidden-import=wsproto",
-        "--hidden-import=wsproto.connection",
-        "--hidden-import=wsproto.events",
-        "--hidden-import=h11",
-        
-        # System tray support
-        "--hidden-import=pystray",
-        "--hidden-import=PIL",
-        "--hidden-import=PIL.Image",
-        "--hidden-import=PIL.ImageDraw",
     ]
     
     # Add icon if available (for window managers that support it)
-    if ICON_FILE and ICON_FILE.exists():
-        args.extend(["--icon", str(ICON_FILE)])
+    if ICON_FILE:
         print(f"   Using icon: {ICON_FILE}")
     else:
         print("   [INFO] No .png icon found")
     
+    # Reuse the previous output when sources, requirements and args are unchanged
+    artifact = DIST_DIR / APP_NAME_LOWER
+    cache_dir = BUILD_DIR / ".build-cache" / artifact.name
+    digest = fingerprint(source_files([ICON_FILE, SPEC_TEMPLATE]), " ".join(args))
+    if not fresh and restore(cache_dir, digest, artifact):
+        print(f"   [OK] Sources unchanged, reused cached build ({digest[:12]})")
+        return True
+    
+    render_spec(
+        SPEC_TEMPLATE,
+        BUILD_DIR / SPEC_TEMPLATE.name,
+        project_root=str(PROJECT_ROOT),
+        static_dir=str(STATIC_DIR),
+        icon=str(ICON_FILE) if ICON_FILE else None,
+    )
+    
+    # Imported here so --help, version lookups and failed dependency
+    # checks don't pay for loading PyInstaller
+    import PyInstaller.__main__
+    
     # Run PyInstaller
     try:
         PyInstaller.__main__.run(args)
+        store(cache_dir, digest, artifact)
         print(f"\n[SUCCESS] Build successful!")
-        print(f"Executable location: {DIST_DIR / APP_NAME_LOWER}")
+        print(f"Executable location: {DIST_DIR / APP_NAME_LOWER / APP_NAME_LOWER}")
         return True
     except Exception as e:
         print(f"\n[ERROR] Build failed: {e}")
@@ -133,60 +146,9 @@ Keywords=bittorrent;tracker;torrent;monitor;
     return desktop_content
 
 
-def create_distribution_package():
-    """Create a distribution package with README and other files"""
-    print("\nCreating distribution package...")
-    
-    # Create distribution directory
-    dist_package = DIST_DIR / f"{APP_NAME}_Linux"
-    dist_package.mkdir(exist_ok=True)
-    
-    # Copy executable
-    exe_src = DIST_DIR / APP_NAME_LOWER
-    exe_dst = dist_package / APP_NAME_LOWER
-    if exe_src.exists():
-        shutil.copy2(exe_src, exe_dst)
-        # Make executable
-        exe_dst.chmod(0o755)
-        print(f"   [OK] Copied: {APP_NAME_LOWER}")
-    
-    # Copy README
-    readme_src = PROJECT_ROOT / "README.md"
-    readme_dst = dist_package / "README.md"
-    if readme_src.exists():
-        shutil.copy2(readme_src, readme_dst)
-        print(f"   [OK] Copied: README.md")
-    
-    # Copy Usage Guide
-    usage_src = PROJECT_ROOT / "docs" / "USAGE_GUIDE.md"
-    usage_dst = dist_package / "USAGE_GUIDE.md"
-    if usage_src.exists():
-        shutil.copy2(usage_src, usage_dst)
-        print(f"   [OK] Copied: USAGE_GUIDE.md")
-    
-    # Copy License
-    license_src = PROJECT_ROOT / "LICENSE"
-    license_dst = dist_package / "LICENSE.txt"
-    if license_src.exists():
-        shutil.copy2(license_src, license_dst)
-        print(f"   [OK] Copied: LICENSE.txt")
-    
-    # Copy icon if exists
-    if ICON_FILE and ICON_FILE.exists():
-        icon_dst = dist_package / "trackerspotter.png"
-        shutil.copy2(ICON_FILE, icon_dst)
-        print(f"   [OK] Copied: trackerspotter.png")
-    
-    # Create desktop entry
-    desktop_dst = dist_package / "trackerspotter.desktop"
-    with open(desktop_dst, 'w', encoding='utf-8') as f:
-        f.write(create_desktop_entry())
-    print(f"   [OK] Created: trackerspotter.desktop")
-    
-    # Create install script
-    install_script = dist_package / "install.sh"
-    with open(install_script, 'w', encoding='utf-8') as f:
-        f.write(f"""#!/bin/bash
+def create_install_script():
+    """Create install.sh content for system-wide installation"""
+    return f"""#!/bin/bash
 # TrackerSpotter v{VERSION} Installation Script
 
 set -e
@@ -199,9 +161,19 @@ if [ "$EUID" -ne 0 ]; then
     exit 1
 fi
 
-# Install binary
-install -Dm755 {APP_NAME_LOWER} /usr/local/bin/{APP_NAME_LOWER}
-echo "  [OK] Installed binary to /usr/local/bin/{APP_NAME_LOWER}"
+# Install application directory (launcher + bundled libraries)
+rm -rf /usr/local/lib/{APP_NAME_LOWER}
+install -Dm755 {APP_NAME_LOWER}/{APP_NAME_LOWER} /usr/local/lib/{APP_NAME_LOWER}/{APP_NAME_LOWER}
+cp -r {APP_NAME_LOWER}/_internal /usr/local/lib/{APP_NAME_LOWER}/
+echo "  [OK] Installed application to /usr/local/lib/{APP_NAME_LOWER}"
+
+# Install launcher shim
+cat > /usr/local/bin/{APP_NAME_LOWER} <<'SHIM'
+#!/bin/sh
+exec /usr/local/lib/{APP_NAME_LOWER}/{APP_NAME_LOWER} "$@"
+SHIM
+chmod 755 /usr/local/bin/{APP_NAME_LOWER}
+echo "  [OK] Installed launcher to /usr/local/bin/{APP_NAME_LOWER}"
 
 # Install icon
 if [ -f "trackerspotter.png" ]; then
@@ -224,14 +196,12 @@ echo ""
 echo "Installation complete!"
 echo "Run 'trackerspotter' from terminal or find it in your application menu."
 echo ""
-""")
-    install_script.chmod(0o755)
-    print(f"   [OK] Created: install.sh")
-    
-    # Create uninstall script
-    uninstall_script = dist_package / "uninstall.sh"
-    with open(uninstall_script, 'w', encoding='utf-8') as f:
-        f.write(f"""#!/bin/bash
+"""
+
+
+def create_uninstall_script():
+    """Create uninstall.sh content"""
+    return f"""#!/bin/bash
 # TrackerSpotter Uninstallation Script
 
 set -e
@@ -244,9 +214,10 @@ if [ "$EUID" -ne 0 ]; then
     exit 1
 fi
 
-# Remove binary
+# Remove launcher and application directory
 rm -f /usr/local/bin/{APP_NAME_LOWER}
-echo "  [OK] Removed binary"
+rm -rf /usr/local/lib/{APP_NAME_LOWER}
+echo "  [OK] Removed application"
 
 # Remove icon
 rm -f /usr/share/icons/hicolor/256x256/apps/trackerspotter.png
@@ -264,59 +235,273 @@ fi
 echo ""
 echo "Uninstallation complete!"
 echo ""
-""")
-    uninstall_script.chmod(0o755)
-    print(f"   [OK] Created: uninstall.sh")
+"""
+
+
+def _do_copy(src, dst, mode=None):
+    """Copy a single file (data only) and optionally set its permissions"""
+    shutil.copy(src, dst)
+    if mode:
+        dst.chmod(mode)
+    print(f"   [OK] Copied: {dst.name}")
+
+
+def _do_copytree(src, dst, launcher):
+    """Copy a directory tree (data only) and mark its launcher executable"""
+    if dst.exists():
+        shutil.rmtree(dst)
+    shutil.copytree(src, dst, copy_function=shutil.copy)
+    (dst / launcher).chmod(0o755)
+    print(f"   [OK] Copied: {dst.name}/")
+
+
+def _do_write(dst, content, mode=None):
+    """Write a generated text file and optionally set its permissions"""
+    dst.write_text(content, encoding='utf-8')
+    if mode:
+        dst.chmod(mode)
+    print(f"   [OK] Created: {dst.name}")
+
+
+def _run_job(job):
+    """Run a single (function, args) packaging job"""
+    func, args = job
+    func(*args)
+
+
+def _run_jobs(jobs):
+    """
+    Run packaging jobs, overlapping their I/O with a thread pool
     
-    print(f"\n[SUCCESS] Distribution package ready: {dist_package}")
+    Args:
+        jobs: List of (function, args) tuples
+    """
+    map_maybe_parallel(_run_job, jobs, max_workers=8, threads=True)
+
+
+def write_checksum(archive_path):
+    """
+    Write <archive>.sha256 next to an archive using the system sha256sum
     
-    # Create tar.gz archive (more common on Linux)
-    try:
-        archive_name = f"{APP_NAME}_Linux"
-        archive_path = shutil.make_archive(
-            str(DIST_DIR / archive_name),
-            'gztar',
-            DIST_DIR,
-            f"{APP_NAME}_Linux"
-        )
-        print(f"tar.gz archive created: {archive_path}")
-    except Exception as e:
-        print(f"[WARNING] Failed to create tar.gz: {e}")
+    The native tool uses the CPU's SHA extensions where available, and running
+    it from the archive's directory keeps the file verifiable with -c.
     
-    # Also create ZIP for convenience
+    Args:
+        archive_path: Path to the archive to checksum
+    """
+    archive_path = Path(archive_path)
+    checksum_path = archive_path.with_name(archive_path.name + ".sha256")
     try:
-        archive_path = shutil.make_archive(
-            str(DIST_DIR / f"{APP_NAME}_Linux"),
-            'zip',
-            dist_package
+        with open(checksum_path, 'w', encoding='utf-8') as out:
+            subprocess.run(
+                ['sha256sum', archive_path.name],
+                cwd=archive_path.parent,
+                stdout=out,
+                check=True
+            )
+        print(f"Checksum created: {checksum_path}")
+    except FileNotFoundError:
+        checksum_path.unlink(missing_ok=True)
+        print("[INFO] sha256sum not found, skipping checksum")
+    except subprocess.CalledProcessError as e:
+        checksum_path.unlink(missing_ok=True)
+        print(f"[WARNING] Failed to create checksum: {e}")
+
+
+def _make_tar_gz(base_name, root_dir, base_dir):
+    """
+    Create <base_name>.tar.gz, compressing with pigz on all cores when available
+    
+    tar streams the tree straight into pigz, so no uncompressed tarball is
+    written; without pigz this falls back to shutil.make_archive.
+    
+    Returns:
+        Path of the archive (as a string, like shutil.make_archive)
+    """
+    pigz = shutil.which('pigz')
+    if not pigz or not shutil.which('tar'):
+        return shutil.make_archive(base_name, 'gztar', root_dir, base_dir)
+    
+    archive_path = f"{base_name}.tar.gz"
+    with open(archive_path, 'wb') as out:
+        tar = subprocess.Popen(
+            ['tar', '-C', str(root_dir), '-cf', '-', base_dir],
+            stdout=subprocess.PIPE
         )
-        print(f"ZIP archive created: {archive_path}")
-    except Exception as e:
-        print(f"[WARNING] Failed to create ZIP: {e}")
+        compressor = subprocess.Popen(
+            [pigz, '-p', str(os.cpu_count() or 1), '-c'],
+            stdin=tar.stdout,
+            stdout=out
+        )
+        tar.stdout.close()  # pigz sees EOF (and tar SIGPIPE) if either side exits
+        compressor.wait()
+        tar.wait()
+    
+    if tar.returncode or compressor.returncode:
+        Path(archive_path).unlink(missing_ok=True)
+        raise RuntimeError(
+            f"tar exited with {tar.returncode}, pigz exited with {compressor.returncode}"
+        )
+    return archive_path
+
+
+def create_distribution_package(formats=("gztar",)):
+    """
+    Create a distribution package with README and other files
+    
+    Args:
+        formats: shutil.make_archive formats to produce from the package directory
+    """
+    print("\nCreating distribution package...")
+    
+    # Create distribution directory
+    dist_package = DIST_DIR / f"{APP_NAME}_Linux"
+    dist_package.mkdir(exist_ok=True)
+    
+    jobs = []
+    
+    # Application directory (launcher + _internal/)
+    app_src = DIST_DIR / APP_NAME_LOWER
+    if app_src.exists():
+        jobs.append((_do_copytree, (app_src, dist_package / APP_NAME_LOWER, APP_NAME_LOWER)))
+    
+    # README, Usage Guide, License and icon
+    docs = [
+        (PROJECT_ROOT / "README.md", "README.md"),
+        (PROJECT_ROOT / "docs" / "USAGE_GUIDE.md", "USAGE_GUIDE.md"),
+        (PROJECT_ROOT / "LICENSE", "LICENSE.txt"),
+    ]
+    if ICON_FILE:
+        docs.append((ICON_FILE, "trackerspotter.png"))
+    for src, name in docs:
+        if src.exists():
+            jobs.append((_do_copy, (src, dist_package / name)))
+    
+    # Desktop entry and install/uninstall scripts
+    jobs.append((_do_write, (dist_package / "trackerspotter.desktop", create_desktop_entry())))
+    jobs.append((_do_write, (dist_package / "install.sh", create_install_script(), 0o755)))
+    jobs.append((_do_write, (dist_package / "uninstall.sh", create_uninstall_script(), 0o755)))
+    
+    _run_jobs(jobs)
+    
+    print(f"\n[SUCCESS] Distribution package ready: {dist_package}")
+    
+    # Create archives (tar.gz by default, more common on Linux)
+    archive_name = f"{APP_NAME}_Linux"
+    for fmt in formats:
+        label = ARCHIVE_FORMATS.get(fmt, fmt)
+        try:
+            if fmt == "gztar":
+                archive_path = _make_tar_gz(str(DIST_DIR / archive_name), DIST_DIR, archive_name)
+            else:
+                archive_path = shutil.make_archive(
+                    str(DIST_DIR / archive_name),
+                    fmt,
+                    DIST_DIR,
+                    archive_name
+                )
+            print(f"{label} archive created: {archive_path}")
+            write_checksum(archive_path)
+        except Exception as e:
+            print(f"[WARNING] Failed to create {label}: {e}")
+
+
+def _build_tar():
+    """
+    Stream the distribution straight into a tar.gz, without a staging directory
+    
+    Used in CI, where only the archive is needed: files are added from their
+    source locations and generated scripts are written from memory.
+    
+    Returns:
+        Path of the archive
+    """
+    print("\nCreating distribution archive (streaming)...")
+    
+    prefix = f"{APP_NAME}_Linux"
+    archive_path = DIST_DIR / f"{prefix}.tar.gz"
+    
+    def add_text(tar, name, content, mode=0o644):
+        data = content.encode("utf-8")
+        info = tarfile.TarInfo(f"{prefix}/{name}")
+        info.size = len(data)
+        info.mode = mode
+        info.mtime = int(time.time())
+        tar.addfile(info, BytesIO(data))
+    
+    launcher = f"{prefix}/{APP_NAME_LOWER}/{APP_NAME_LOWER}"
+    
+    def mark_launcher(info):
+        if info.name == launcher:
+            info.mode |= 0o755
+        return info
+    
+    with tarfile.open(archive_path, "w:gz") as tar:
+        # Application directory (launcher + _internal/)
+        app_src = DIST_DIR / APP_NAME_LOWER
+        if app_src.exists():
+            tar.add(app_src, arcname=f"{prefix}/{APP_NAME_LOWER}", filter=mark_launcher)
+        
+        # README, Usage Guide, License and icon
+        docs = [
+            (PROJECT_ROOT / "README.md", "README.md"),
+            (PROJECT_ROOT / "docs" / "USAGE_GUIDE.md", "USAGE_GUIDE.md"),
+            (PROJECT_ROOT / "LICENSE", "LICENSE.txt"),
+        ]
+        if ICON_FILE:
+            docs.append((ICON_FILE, "trackerspotter.png"))
+        for src, name in docs:
+            if src.exists():
+                tar.add(src, arcname=f"{prefix}/{name}")
+        
+        # Desktop entry and install/uninstall scripts
+        add_text(tar, "trackerspotter.desktop", create_desktop_entry())
+        add_text(tar, "install.sh", create_install_script(), 0o755)
+        add_text(tar, "uninstall.sh", create_uninstall_script(), 0o755)
+    
+    print(f"tar.gz archive created: {archive_path}")
+    write_checksum(archive_path)
+    return archive_path
+
+
+def parse_archive_formats(argv):
+    """
+    Parse --archive-format=tar.gz,zip from the command line
+    
+    Args:
+        argv: Command line arguments
+        
+    Returns:
+        List of shutil.make_archive format names (default: ["gztar"])
+    """
+    aliases = {"tar.gz": "gztar", "tgz": "gztar", "gztar": "gztar", "zip": "zip"}
+    for arg in argv:
+        if arg.startswith("--archive-format="):
+            names = [n.strip() for n in arg.split("=", 1)[1].split(",") if n.strip()]
+            unknown = [n for n in names if n not in aliases]
+            if unknown:
+                print(f"[ERROR] Unknown archive format(s): {', '.join(unknown)}")
+                sys.exit(1)
+            return [aliases[n] for n in names]
+    return ["gztar"]
 
 
 def verify_dependencies():
     """Verify all required packages are installed without importing them"""
-    import os
+    print("Verifying dependencies...")
     
     # In CI environments, skip verification to avoid X display issues
     # Packages are installed via requirements.txt, so we trust they're there
-    # Check multiple CI environment variables (GitHub Actions sets GITHUB_ACTIONS)
-    ci_env_vars = ['CI', 'GITHUB_ACTIONS', 'GITHUB_WORKFLOW', 'RUNNER_OS']
-    is_ci = any(os.environ.get(var) for var in ci_env_vars)
-    
-    if is_ci:
-        print("Verifying dependencies...")
-        print("   [SKIP] Running in CI - dependencies installed via requirements.txt")
+    if IS_CI:
+        ci_vars = ", ".join(f"{k}={v}" for k, v in _CI_ENV.items())
+        print(f"   [SKIP] Running in CI ({ci_vars}) - dependencies installed via requirements.txt")
         print("   [OK] All dependencies (assumed installed)")
         return True
     
-    print("Verifying dependencies...")
-    
     # Set DISPLAY environment variable if not set (for headless environments)
     if 'DISPLAY' not in os.environ:
         os.environ['DISPLAY'] = ':99'
-        print(f"   [INFO] Set DISPLAY={os.environ['DISPLAY']}")
+        print("   [INFO] Set DISPLAY=:99")
     
     # Use importlib.metadata (Python 3.8+) to check packages without importing
     # This is safer than find_spec which can trigger module loading
@@ -368,21 +553,7 @@ def verify_dependencies():
 
 def main():
     """Main build process"""
-    import os
-    
-    # Early CI detection - skip verification entirely in CI
-    # GitHub Actions sets GITHUB_ACTIONS=true, RUNNER_OS, etc.
-    is_ci = any(os.environ.get(var) for var in ['CI', 'GITHUB_ACTIONS', 'GITHUB_WORKFLOW', 'RUNNER_OS'])
-    
-    if is_ci:
-        print("""
-=============================================================
-          TrackerSpotter Build Script
-          Creating Linux Executable
-=============================================================
-""")
-    else:
-        print("""
+    print("""
 =============================================================
           TrackerSpotter Build Script
           Creating Linux Executable
@@ -390,28 +561,34 @@ def main():
 """)
     
     # Check platform (skip interactive prompt in CI)
-    if sys.platform != 'linux':
+    if not IS_LINUX:
         print("[WARNING] This script is designed for Linux.")
         print("         Cross-compilation may not work correctly.")
-        if not is_ci:
+        if not IS_CI:
             response = input("Continue anyway? [y/N]: ")
             if response.lower() != 'y':
                 sys.exit(0)
     
     # Verify dependencies (skip in CI)
-    if not is_ci:
+    if not IS_CI:
         if not verify_dependencies():
             sys.exit(1)
     
-    # Clean old builds
-    clean_build_directories()
+    # Clean old builds (pass --fresh to also drop the PyInstaller cache)
+    fresh = "--fresh" in sys.argv
+    clean_build_directories(fresh=fresh)
     
     # Build executable
-    if not build_executable():
+    if not build_executable(fresh=fresh):
         sys.exit(1)
     
-    # Create distribution package
-    create_distribution_package()
+    # Create distribution package (--archive-format=tar.gz,zip for both)
+    formats = parse_archive_formats(sys.argv[1:])
+    if IS_CI and formats == ["gztar"]:
+        # CI only uploads the tarball, so skip the staging directory
+        _build_tar()
+    else:
+        create_distribution_package(formats)
     
     print(f"""
 =============================================================
@@ -421,13 +598,13 @@ def main():
 Your Linux executable is ready to distribute!
 
 To test:
-  1. Go to: dist/{APP_NAME}_v{VERSION}_Linux/
-  2. Run: ./{APP_NAME_LOWER}
+  1. Go to: dist/{APP_NAME}_Linux/
+  2. Run: ./{APP_NAME_LOWER}/{APP_NAME_LOWER}
   3. Or install system-wide: sudo ./install.sh
 
 To distribute:
-  - Share the tar.gz: dist/{APP_NAME}_v{VERSION}_Linux.tar.gz
-  - Or share the ZIP: dist/{APP_NAME}_v{VERSION}_Linux.zip
+  - Share the tar.gz: dist/{APP_NAME}_Linux.tar.gz
+  - Need a ZIP too? Re-run with --archive-format=tar.gz,zip
 
 Note: For system tray support, ensure a system tray is available
 (GNOME users may need the AppIndicator extension).
@@ -4,43 +4,49 @@ Build script for creating macOS application bundle using PyInstaller
 
 import os
 import sys
-import re
 import shutil
+import subprocess
 from pathlib import Path
-import PyInstaller.__main__
+
+from _common import get_version, remove_tree, render_spec
+from _cache import fingerprint, restore, source_files, store
+from _parallel import map_maybe_parallel
 
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent
 SRC_DIR = PROJECT_ROOT / "src"
-DIST_DIR = PROJECT_ROOT / "dist"
-BUILD_DIR = PROJECT_ROOT / "build"
+# TS_BUILD_SUBDIR gives each platform its own work/dist tree (see build_all.py)
+BUILD_SUBDIR = os.environ.get("TS_BUILD_SUBDIR", "")
+DIST_DIR = PROJECT_ROOT / "dist" / BUILD_SUBDIR
+BUILD_DIR = PROJECT_ROOT / "build" / BUILD_SUBDIR
 STATIC_DIR = SRC_DIR / "trackerspotter" / "static"
 ICONS_DIR = PROJECT_ROOT / "icons"
-
-
-def get_version():
-    """Read version from __init__.py (single source of truth)"""
-    init_file = SRC_DIR / "trackerspotter" / "__init__.py"
-    content = init_file.read_text(encoding="utf-8")
-    match = re.search(r'__version__\s*=\s*["\']([^"\']+)["\']', content)
-    return match.group(1) if match else "0.0.0"
+SPEC_TEMPLATE = Path(__file__).parent / "specs" / "macos.spec"
 
 
 # Build configuration
 APP_NAME = "TrackerSpotter"
 VERSION = get_version()
 BUNDLE_ID = "com.trackerspotter.app"
-ICON_FILE = ICONS_DIR / "trackerspotter.icns" if (ICONS_DIR / "trackerspotter.icns").exists() else None
+_icon = ICONS_DIR / "trackerspotter.icns"
+ICON_FILE = _icon if _icon.is_file() else None
 
 
-def clean_build_directories():
-    """Clean previous build artifacts"""
+def clean_build_directories(fresh: bool = False):
+    """
+    Clean previous build artifacts
+    
+    Args:
+        fresh: Also remove the PyInstaller work directory (forces a full rebuild)
+    """
     print("Cleaning build directories...")
     
-    for directory in [DIST_DIR, BUILD_DIR]:
+    # Keep BUILD_DIR by default so PyInstaller can reuse its cached analysis
+    directories = [DIST_DIR, BUILD_DIR] if fresh else [DIST_DIR]
+    for directory in directories:
         if directory.exists():
             try:
-                shutil.rmtree(directory)
+                remove_tree(directory)
                 print(f"   Removed: {directory}")
             except PermissionError as e:
                 print(f"   [WARNING] Could not remove {directory}: {e}")
@@ -57,62 +63,55 @@ def clean_build_directories():
             print(f"   [WARNING] Could not remove {spec_file}: {e}")
 
 
-def build_app_bundle():
-    """Build the macOS application bundle using PyInstaller"""
+def build_app_bundle(fresh: bool = False):
+    """
+    Build the macOS application bundle using PyInstaller
+    
+    Args:
+        fresh: Ignore the build cache and always run PyInstaller
+    """
     print(f"\nBuilding {APP_NAME} v{VERSION} for macOS...")
     
-    # PyInstaller arguments for macOS
+    # Hidden imports, data files and bundle layout live in specs/macos.spec
     args = [
-        str(PROJECT_ROOT / "trackerspotter.py"),  # Entry point
-        "--name", APP_NAME,
-        "--onefile",  # Single executable (inside .app bundle)
-        "--windowed",  # Create .app bundle (no terminal window)
-        "--clean",
+        str(BUILD_DIR / SPEC_TEMPLATE.name),
+        "--noconfirm",
         f"--distpath={DIST_DIR}",
         f"--workpath={BUILD_DIR}",
-        
-        # Add data files (static folder)
-        f"--add-data={STATIC_DIR}:trackerspotter/static",
-        
-        # macOS specific
-        f"--osx-bundle-identifier={BUNDLE_ID}",
-        
-        # Core dependencies
-        "--hidden-import=flask",
-        "--hidden-import=bencodepy",
-        
-        # Flask-SocketIO and dependencies
-        "--hidden-import=flask_socketio",
-        "--hidden-import=socketio",
-        "--hidden-import=socketio.server",
-        "--hidden-import=engineio",
-        "--hidden-import=engineio.server",
-        "--hidden-import=engineio.async_drivers.threading",
-        
-        # WebSocket support
-        "--hidden-import=simple_websocket",
-        "--hidden-import=wsproto",
-        "--hidden-import=wsproto.connection",
-        "--hidden-import=wsproto.events",
-        "--hidden-import=h11",
-        
-        # System tray support
-        "--hidden-import=pystray",
-        "--hidden-import=PIL",
-        "--hidden-import=PIL.Image",
-        "--hidden-import=PIL.ImageDraw",
     ]
     
     # Add icon if available
-    if ICON_FILE and ICON_FILE.exists():
-        args.extend(["--icon", str(ICON_FILE)])
+    if ICON_FILE:
         print(f"   Using icon: {ICON_FILE}")
     else:
         print("   [INFO] No .icns icon found, using default")
     
+    # Reuse the previous output when sources, requirements and args are unchanged
+    artifact = DIST_DIR / f"{APP_NAME}.app"
+    cache_dir = BUILD_DIR / ".build-cache" / artifact.name
+    digest = fingerprint(source_files([ICON_FILE, SPEC_TEMPLATE]), " ".join(args))
+    if not fresh and restore(cache_dir, digest, artifact):
+        print(f"   [OK] Sources unchanged, reused cached build ({digest[:12]})")
+        return True
+    
+    render_spec(
+        SPEC_TEMPLATE,
+        BUILD_DIR / SPEC_TEMPLATE.name,
+        project_root=str(PROJECT_ROOT),
+        static_dir=str(STATIC_DIR),
+        icon=str(ICON_FILE) if ICON_FILE else None,
+        version=VERSION,
+        bundle_id=BUNDLE_ID,
+    )
+    
+    # Imported here so --help, version lookups and failed dependency
+    # checks don't pay for loading PyInstaller
+    import PyInstaller.__main__
+    
     # Run PyInstaller
     try:
         PyInstaller.__main__.run(args)
+        store(cache_dir, digest, artifact)
         print(f"\n[SUCCESS] Build successful!")
         print(f"App bundle location: {DIST_DIR / APP_NAME}.app")
         return True
@@ -121,6 +120,68 @@ def build_app_bundle():
         return False
 
 
+def _do_copy(src, dst, mode=None):
+    """Copy a single file (data only) and optionally set its permissions"""
+    shutil.copy(src, dst)
+    if mode:
+        dst.chmod(mode)
+    print(f"   [OK] Copied: {dst.name}")
+
+
+def _do_copytree(src, dst):
+    """Copy an app bundle (data only), keeping its internal symlinks as links"""
+    if dst.exists():
+        shutil.rmtree(dst)
+    # Timestamps/xattrs are irrelevant for the ZIP/DMG
+    shutil.copytree(src, dst, symlinks=True, copy_function=shutil.copy)
+    print(f"   [OK] Copied: {dst.name}")
+
+
+def _run_job(job):
+    """Run a single (function, args) packaging job"""
+    func, args = job
+    func(*args)
+
+
+def _run_jobs(jobs):
+    """
+    Run packaging jobs, overlapping their I/O with a thread pool
+    
+    Args:
+        jobs: List of (function, args) tuples
+    """
+    map_maybe_parallel(_run_job, jobs, max_workers=8, threads=True)
+
+
+def write_checksum(archive_path):
+    """
+    Write <archive>.sha256 next to an archive using the system shasum
+    
+    The native tool uses the CPU's SHA extensions where available, and running
+    it from the archive's directory keeps the file verifiable with -c.
+    
+    Args:
+        archive_path: Path to the archive to checksum
+    """
+    archive_path = Path(archive_path)
+    checksum_path = archive_path.with_name(archive_path.name + ".sha256")
+    try:
+        with open(checksum_path, 'w', encoding='utf-8') as out:
+            subprocess.run(
+                ['shasum', '-a', '256', archive_path.name],
+                cwd=archive_path.parent,
+                stdout=out,
+                check=True
+            )
+        print(f"Checksum created: {checksum_path}")
+    except FileNotFoundError:
+        checksum_path.unlink(missing_ok=True)
+        print("[INFO] shasum not found, skipping checksum")
+    except subprocess.CalledProcessError as e:
+        checksum_path.unlink(missing_ok=True)
+        print(f"[WARNING] Failed to create checksum: {e}")
+
+
 def create_distribution_package():
     """Create a distribution package with README and other files"""
     print("\nCreating distribution package...")
@@ -129,35 +190,24 @@ def create_distribution_package():
     dist_package = DIST_DIR / f"{APP_NAME}_macOS"
     dist_package.mkdir(exist_ok=True)
     
-    # Copy app bundle
+    jobs = []
+    
+    # App bundle
     app_src = DIST_DIR / f"{APP_NAME}.app"
-    app_dst = dist_package / f"{APP_NAME}.app"
     if app_src.exists():
-        if app_dst.exists():
-            shutil.rmtree(app_dst)
-        shutil.copytree(app_src, app_dst)
-        print(f"   [OK] Copied: {APP_NAME}.app")
-    
-    # Copy README
-    readme_src = PROJECT_ROOT / "README.md"
-    readme_dst = dist_package / "README.md"
-    if readme_src.exists():
-        shutil.copy2(readme_src, readme_dst)
-        print(f"   [OK] Copied: README.md")
-    
-    # Copy Usage Guide
-    usage_src = PROJECT_ROOT / "docs" / "USAGE_GUIDE.md"
-    usage_dst = dist_package / "USAGE_GUIDE.md"
-    if usage_src.exists():
-        shutil.copy2(usage_src, usage_dst)
-        print(f"   [OK] Copied: USAGE_GUIDE.md")
-    
-    # Copy License
-    license_src = PROJECT_ROOT / "LICENSE"
-    license_dst = dist_package / "LICENSE.txt"
-    if license_src.exists():
-        shutil.copy2(license_src, license_dst)
-        print(f"   [OK] Copied: LICENSE.txt")
+        jobs.append((_do_copytree, (app_src, dist_package / f"{APP_NAME}.app")))
+    
+    # README, Usage Guide and License
+    docs = [
+        (PROJECT_ROOT / "README.md", "README.md"),
+        (PROJECT_ROOT / "docs" / "USAGE_GUIDE.md", "USAGE_GUIDE.md"),
+        (PROJECT_ROOT / "LICENSE", "LICENSE.txt"),
+    ]
+    for src, name in docs:
+        if src.exists():
+            jobs.append((_do_copy, (src, dist_package / name)))
+    
+    _run_jobs(jobs)
     
     print(f"\n[SUCCESS] Distribution package ready: {dist_package}")
     
@@ -170,12 +220,12 @@ def create_distribution_package():
             dist_package
         )
         print(f"ZIP archive created: {archive_path}")
+        write_checksum(archive_path)
     except Exception as e:
         print(f"[WARNING] Failed to create ZIP: {e}")
     
     # Also create DMG if hdiutil is available (macOS only)
     try:
-        import subprocess
         dmg_path = DIST_DIR / f"{APP_NAME}_macOS.dmg"
         
         # Remove existing DMG
@@ -192,6 +242,7 @@ def create_distribution_package():
             str(dmg_path)
         ], check=True)
         print(f"DMG created: {dmg_path}")
+        write_checksum(dmg_path)
     except FileNotFoundError:
         print("[INFO] hdiutil not found, skipping DMG creation")
     except subprocess.CalledProcessError as e:
@@ -201,24 +252,30 @@ def create_distribution_package():
 
 
 def verify_dependencies():
-    """Verify all required packages are installed"""
+    """Verify all required packages are installed without importing them"""
     print("Verifying dependencies...")
     
-    required_packages = [
+    # Use importlib.metadata to check packages without importing
+    # (importing pystray initializes AppKit, Flask pulls in dozens of modules)
+    from importlib import metadata
+    
+    # Package names as they appear in pip (not module names)
+    packages_to_check = [
         ("flask", "flask"),
-        ("flask_socketio", "flask_socketio"),
+        ("flask-socketio", "flask_socketio"),
         ("bencodepy", "bencodepy"),
         ("pystray", "pystray"),
-        ("PIL", "Pillow"),
-        ("PyInstaller", "pyinstaller"),
+        ("Pillow", "PIL"),
+        ("pyinstaller", "PyInstaller"),
     ]
     
     missing = []
-    for module_name, package_name in required_packages:
+    for package_name, module_name in packages_to_check:
         try:
-            __import__(module_name)
-            print(f"   [OK] {package_name}")
-        except ImportError:
+            # Check if package is installed using metadata (no import happens)
+            dist = metadata.distribution(package_name)
+            print(f"   [OK] {package_name} (version: {dist.version})")
+        except metadata.PackageNotFoundError:
             print(f"   [MISSING] {package_name}")
             missing.append(package_name)
     
@@ -252,11 +309,12 @@ def main():
     if not verify_dependencies():
         sys.exit(1)
     
-    # Clean old builds
-    clean_build_directories()
+    # Clean old builds (pass --fresh to also drop the PyInstaller cache)
+    fresh = "--fresh" in sys.argv
+    clean_build_directories(fresh=fresh)
     
     # Build app bundle
-    if not build_app_bundle():
+    if not build_app_bundle(fresh=fresh):
         sys.exit(1)
     
     # Create distribution package
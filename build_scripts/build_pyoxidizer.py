@@ -0,0 +1,81 @@
+"""
+Build script for creating a release executable with PyOxidizer
+
+Unlike the PyInstaller builds, pure-Python modules are embedded in the
+executable and imported from memory (see pyoxidizer.bzl), so nothing is
+extracted to a temp directory at launch.
+
+Requires PyOxidizer: pip install pyoxidizer
+"""
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+from _common import get_version
+
+PROJECT_ROOT = Path(__file__).parent.parent
+BUILD_DIR = PROJECT_ROOT / "build"
+CONFIG_FILE = PROJECT_ROOT / "pyoxidizer.bzl"
+
+APP_NAME = "TrackerSpotter"
+VERSION = get_version()
+
+
+def build_release():
+    """
+    Run pyoxidizer build --release for the default (install) target
+
+    Returns:
+        Path of the install directory, or None if the build failed
+    """
+    pyoxidizer = shutil.which("pyoxidizer")
+    if not pyoxidizer:
+        print("[ERROR] pyoxidizer not found")
+        print("Install with: pip install pyoxidizer")
+        return None
+
+    print(f"\nBuilding {APP_NAME} v{VERSION} with PyOxidizer...")
+    try:
+        subprocess.run(
+            [pyoxidizer, "build", "--release", "--path", str(PROJECT_ROOT)],
+            cwd=PROJECT_ROOT,
+            check=True
+        )
+    except subprocess.CalledProcessError as e:
+        print(f"\n[ERROR] Build failed: pyoxidizer exited with {e.returncode}")
+        return None
+
+    # Output goes to build/<target triple>/release/install
+    installs = sorted(BUILD_DIR.glob("*/release/install"), key=lambda p: p.stat().st_mtime)
+    if not installs:
+        print(f"\n[ERROR] Build output not found under {BUILD_DIR}")
+        return None
+    return installs[-1]
+
+
+def main():
+    """Main build process"""
+    print("""
+=============================================================
+          TrackerSpotter Build Script
+          Creating PyOxidizer Release Executable
+=============================================================
+""")
+
+    if not CONFIG_FILE.exists():
+        print(f"[ERROR] {CONFIG_FILE} not found")
+        sys.exit(1)
+
+    install_dir = build_release()
+    if install_dir is None:
+        sys.exit(1)
+
+    print(f"\n[SUCCESS] Build successful!")
+    print(f"Install directory: {install_dir}")
+    print("Ship the whole directory: trackerspotter/static/ and lib/ sit next to the executable")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,29 +1,31 @@
 """
 Build script for creating Windows executable using PyInstaller
+
+Bundled modules are compiled with optimization level 2 (like python -OO), so
+docstrings and assert statements are stripped from the executable.
 """
 
+import importlib.util
 import os
 import sys
-import re
 import shutil
+import zipfile
 from pathlib import Path
-import PyInstaller.__main__
+
+from _common import get_version, remove_tree, render_spec
+from _parallel import map_maybe_parallel
 
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent
 SRC_DIR = PROJECT_ROOT / "src"
-DIST_DIR = PROJECT_ROOT / "dist"
-BUILD_DIR = PROJECT_ROOT / "build"
+# TS_BUILD_SUBDIR gives each platform its own work/dist tree (see build_all.py)
+BUILD_SUBDIR = os.environ.get("TS_BUILD_SUBDIR", "")
+DIST_DIR = PROJECT_ROOT / "dist" / BUILD_SUBDIR
+BUILD_DIR = PROJECT_ROOT / "build" / BUILD_SUBDIR
 STATIC_DIR = SRC_DIR / "trackerspotter" / "static"
 ICONS_DIR = PROJECT_ROOT / "icons"
-
-
-def get_version():
-    """Read version from __init__.py (single source of truth)"""
-    init_file = SRC_DIR / "trackerspotter" / "__init__.py"
-    content = init_file.read_text(encoding="utf-8")
-    match = re.search(r'__version__\s*=\s*["\']([^"\']+)["\']', content)
-    return match.group(1) if match else "0.0.0"
+UPX_DIR = PROJECT_ROOT / "tools" / "upx"
+SPEC_TEMPLATE = Path(__file__).parent / "specs" / "windows.spec"
 
 
 # Build configuration
@@ -32,132 +34,208 @@ VERSION = get_version()
 ICON_FILE = ICONS_DIR / "trackerspotter.ico" if (ICONS_DIR / "trackerspotter.ico").exists() else None
 
 
-def clean_build_directories():
-    """Clean previous build artifacts"""
+def clean_build_directories(fresh: bool = False):
+    """
+    Clean previous build artifacts
+    
+    Args:
+        fresh: Also remove the PyInstaller work directory (forces a full rebuild)
+    """
     print("Cleaning build directories...")
     
-    for directory in [DIST_DIR, BUILD_DIR]:
+    # Keep BUILD_DIR by default so PyInstaller can reuse its cached analysis
+    directories = [DIST_DIR, BUILD_DIR] if fresh else [DIST_DIR]
+    for directory in directories:
         if directory.exists():
             try:
-                shutil.rmtree(directory)
+                remove_tree(directory)
                 print(f"   Removed: {directory}")
             except PermissionError as e:
                 print(f"   [WARNING] Could not remove {directory}: {e}")
                 print(f"   [INFO] Continuing with build (files may be locked by another process)")
             except Exception as e:
                 print(f"   [WARNING] Could not remove {directory}: {e}")
-    
-    # Remove spec file
-    spec_file = PROJECT_ROOT / f"{APP_NAME}.spec"
-    if spec_file.exists():
-        try:
-            spec_file.unlink()
-            print(f"   Removed: {spec_file}")
-        except Exception as e:
-            print(f"   [WARNING] Could not remove {spec_file}: {e}")
 
 
-def build_executable():
-    """Build the Windows executable using PyInstaller"""
+def build_executable(fresh: bool = False, portable: bool = False, tray: bool = True):
+    """
+    Build the Windows executable using PyInstaller
+    
+    Args:
+        fresh: Pass --clean so PyInstaller discards its cache
+        portable: Build a single self-extracting .exe instead of a folder
+        tray: Bundle pystray/Pillow for the system tray icon
+    """
     print(f"\nBuilding {APP_NAME} v{VERSION}...")
     
-    # PyInstaller arguments
+    # Hidden imports, data files and bundle layout live in specs/windows.spec
     args = [
-        str(PROJECT_ROOT / "trackerspotter.py"),  # Entry point
-        "--name", APP_NAME,
-        "--onefile",  # Single executable
-        "--windowed",  # No console window (GUI app)
-        "--clean",
+        str(BUILD_DIR / SPEC_TEMPLATE.name),
+        "--noconfirm",
         f"--distpath={DIST_DIR}",
         f"--workpath={BUILD_DIR}",
-        
-        # Add data files (static folder)
-        f"--add-data={STATIC_DIR}{os.pathsep}trackerspotter/static",
-        
-        # Core dependencies
-        "--hidden-import=flask",
-        "--hidden-import=bencodepy",
-        
-        # Flask-SocketIO and dependencies
-        "--hidden-import=flask_socketio",
-        "--hidden-import=socketio",
-        "--hidden-import=socketio.server",
-        "--hidden-import=engineio",
-        "--hidden-import=engineio.server",
-        "--hidden-import=engineio.async_drivers.threading",
-        
-        # WebSocket support
-        "--hidden-import=simple_websocket",
-        "--hidden-import=wsproto",
-        "--hidden-import=wsproto.connection",
-        "--hidden-import=wsproto.events",
-        "--hidden-import=h11",
-        
-        # System tray support
-        "--hidden-import=pystray",
-        "--hidden-import=PIL",
-        "--hidden-import=PIL.Image",
-        "--hidden-import=PIL.ImageDraw",
-        
-        # Console for debugging (remove --windowed above and uncomment this for debug builds)
-        # "--console",
     ]
     
-    # Add icon if available
-    if ICON_FILE and ICON_FILE.exists():
-        args.extend(["--icon", str(ICON_FILE)])
+    if not tray:
+        print("   [INFO] Building without system tray support")
+    
+    if fresh:
+        args.append("--clean")
+    
+    # Compress with UPX when it is bundled in tools/upx (TRACKERSPOTTER_NO_UPX=1
+    # trades the smaller download for faster startup). --noupx is a makespec
+    # option that PyInstaller rejects alongside a .spec, so the switch goes
+    # into the rendered spec instead.
+    use_upx = not os.environ.get("TRACKERSPOTTER_NO_UPX")
+    if not use_upx:
+        print("   [INFO] UPX compression disabled")
+    elif (UPX_DIR / "upx.exe").exists():
+        args.append(f"--upx-dir={UPX_DIR}")
+        print(f"   Using UPX: {UPX_DIR}")
+    
+    render_spec(
+        SPEC_TEMPLATE,
+        BUILD_DIR / SPEC_TEMPLATE.name,
+        project_root=str(PROJECT_ROOT),
+        static_dir=str(STATIC_DIR),
+        icon=str(ICON_FILE) if ICON_FILE else None,
+        portable=portable,
+        tray=tray,
+        upx=use_upx,
+        # Known to break when packed
+        upx_exclude=[
+            "vcruntime140.dll",
+            "python3.dll",
+            f"python{sys.version_info.major}{sys.version_info.minor}.dll",
+        ],
+    )
+    
+    # Imported here so --help, version lookups and failed dependency
+    # checks don't pay for loading PyInstaller
+    import PyInstaller.__main__
     
     # Run PyInstaller
     try:
         PyInstaller.__main__.run(args)
         print(f"\n[SUCCESS] Build successful!")
-        print(f"Executable location: {DIST_DIR / APP_NAME}.exe")
+        exe_dir = DIST_DIR if portable else DIST_DIR / APP_NAME
+        print(f"Executable location: {exe_dir / APP_NAME}.exe")
         return True
     except Exception as e:
         print(f"\n[ERROR] Build failed: {e}")
         return False
 
 
-def create_distribution_package():
-    """Create a distribution package with README and other files"""
+def _do_copy(src, dst):
+    """Copy a single file's data (metadata is irrelevant for a redistribution)"""
+    shutil.copyfile(src, dst)
+    print(f"   [OK] Copied: {dst.name}")
+
+
+def _do_copytree(src, dst):
+    """Copy a directory tree (data only)"""
+    if dst.exists():
+        shutil.rmtree(dst)
+    shutil.copytree(src, dst, copy_function=shutil.copyfile)
+    print(f"   [OK] Copied: {dst.name}/")
+
+
+def _run_job(job):
+    """Run a single (function, args) packaging job"""
+    func, args = job
+    func(*args)
+
+
+def _run_jobs(jobs):
+    """
+    Run packaging jobs, overlapping their I/O with a thread pool
+    
+    Args:
+        jobs: List of (function, args) tuples
+    """
+    map_maybe_parallel(_run_job, jobs, max_workers=4, min_for_pool=2, threads=True)
+
+
+def _walk(root):
+    """
+    Yield every entry below root using os.scandir
+    
+    The --onedir tree holds thousands of small files; scandir reuses the
+    directory listing's type information instead of a stat per path.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                yield entry
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+
+
+def write_zip(archive_path, src_dir, release=False):
+    """
+    Zip the contents of a directory
+    
+    Dev builds store files uncompressed: the PyInstaller payload barely
+    shrinks, so DEFLATE would mostly burn CPU. Release builds compress.
+    
+    Args:
+        archive_path: ZIP file to create
+        src_dir: Directory whose contents become the archive root
+        release: Use DEFLATE (level 9) instead of ZIP_STORED
+    """
+    if release:
+        options = {"compression": zipfile.ZIP_DEFLATED, "compresslevel": 9}
+    else:
+        options = {"compression": zipfile.ZIP_STORED}
+    
+    with zipfile.ZipFile(archive_path, 'w', **options) as zf:
+        for entry in _walk(src_dir):
+            zf.write(entry.path, os.path.relpath(entry.path, src_dir))
+
+
+def create_distribution_package(portable: bool = False, release: bool = False):
+    """
+    Create a distribution package with README and other files
+    
+    Args:
+        portable: Package the single-file build instead of the app folder
+        release: Compress the ZIP archive (dev builds store files as-is)
+    """
     print("\nCreating distribution package...")
     
     # Create distribution directory
     dist_package = DIST_DIR / f"{APP_NAME}_Windows"
     dist_package.mkdir(exist_ok=True)
     
-    # Copy executable
-    exe_src = DIST_DIR / f"{APP_NAME}.exe"
-    exe_dst = dist_package / f"{APP_NAME}.exe"
-    if exe_src.exists():
-        shutil.copy2(exe_src, exe_dst)
-        print(f"   [OK] Copied: {APP_NAME}.exe")
-    
-    # Copy README
-    readme_src = PROJECT_ROOT / "README.md"
-    readme_dst = dist_package / "README.md"
-    if readme_src.exists():
-        shutil.copy2(readme_src, readme_dst)
-        print(f"   [OK] Copied: README.md")
-    
-    # Copy Usage Guide
-    usage_src = PROJECT_ROOT / "docs" / "USAGE_GUIDE.md"
-    usage_dst = dist_package / "USAGE_GUIDE.md"
-    if usage_src.exists():
-        shutil.copy2(usage_src, usage_dst)
-        print(f"   [OK] Copied: USAGE_GUIDE.md")
-    
-    # Copy License
-    license_src = PROJECT_ROOT / "LICENSE"
-    license_dst = dist_package / "LICENSE.txt"
-    if license_src.exists():
-        shutil.copy2(license_src, license_dst)
-        print(f"   [OK] Copied: LICENSE.txt")
+    jobs = []
+    
+    # Copy executable (portable) or the app folder (exe + _internal/)
+    if portable:
+        exe_src = DIST_DIR / f"{APP_NAME}.exe"
+        if exe_src.exists():
+            jobs.append((_do_copy, (exe_src, dist_package / f"{APP_NAME}.exe")))
+    else:
+        app_src = DIST_DIR / APP_NAME
+        if app_src.exists():
+            jobs.append((_do_copytree, (app_src, dist_package / APP_NAME)))
+    
+    # README, Usage Guide and License
+    docs = [
+        (PROJECT_ROOT / "README.md", "README.md"),
+        (PROJECT_ROOT / "docs" / "USAGE_GUIDE.md", "USAGE_GUIDE.md"),
+        (PROJECT_ROOT / "LICENSE", "LICENSE.txt"),
+    ]
+    for src, name in docs:
+        if src.exists():
+            jobs.append((_do_copy, (src, dist_package / name)))
+    
+    _run_jobs(jobs)
     
     # Create quick start file
+    exe_path = f"{APP_NAME}.exe" if portable else f"{APP_NAME}\\{APP_NAME}.exe"
     quickstart_dst = dist_package / "QUICKSTART.txt"
-    with open(quickstart_dst, 'w', encoding='utf-8') as f:
-        f.write(f"""
+    quickstart_dst.write_text(f"""
 =============================================================
               TrackerSpotter v{VERSION}
           Local BitTorrent Tracker Monitor
@@ -165,7 +243,7 @@ def create_distribution_package():
 
 QUICK START:
 
-1. Double-click TrackerSpotter.exe to run
+1. Double-click {exe_path} to run
    (Your browser will open automatically)
 
 2. Copy a tracker URL from the dashboard:
@@ -189,43 +267,56 @@ TROUBLESHOOTING:
 - Need help? Visit: https://github.com/jbesclapez/TrackerSpotter
 
 Made with love for the BitTorrent community
-""")
+""", encoding='utf-8')
     print(f"   [OK] Created: QUICKSTART.txt")
     
     print(f"\n[SUCCESS] Distribution package ready: {dist_package}")
     
     # Create ZIP archive
     try:
-        archive_name = f"{APP_NAME}_Windows"
-        archive_path = shutil.make_archive(
-            str(DIST_DIR / archive_name),
-            'zip',
-            dist_package
-        )
+        archive_path = DIST_DIR / f"{APP_NAME}_Windows.zip"
+        write_zip(archive_path, dist_package, release=release)
         print(f"ZIP archive created: {archive_path}")
     except Exception as e:
         print(f"[WARNING] Failed to create ZIP: {e}")
 
 
-def verify_dependencies():
-    """Verify all required packages are installed"""
+def _is_installed(module_name):
+    """Check whether a top-level module can be imported, without importing it"""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def verify_dependencies(tray: bool = True):
+    """
+    Verify all required packages are installed
+    
+    Args:
+        tray: Also require the system tray packages
+    """
     print("Verifying dependencies...")
     
     required_packages = [
         ("flask", "flask"),
         ("flask_socketio", "flask_socketio"),
         ("bencodepy", "bencodepy"),
-        ("pystray", "pystray"),
-        ("PIL", "Pillow"),
         ("PyInstaller", "pyinstaller"),  # Module name vs package name
     ]
+    if tray:
+        required_packages += [("pystray", "pystray"), ("PIL", "Pillow")]
+    
+    # find_spec only locates each module, so no package code runs here
+    found = map_maybe_parallel(
+        _is_installed, [module_name for module_name, _ in required_packages], threads=True
+    )
     
     missing = []
-    for module_name, package_name in required_packages:
-        try:
-            __import__(module_name)
+    for (_, package_name), installed in zip(required_packages, found):
+        if installed:
             print(f"   [OK] {package_name}")
-        except ImportError:
+        else:
             print(f"   [MISSING] {package_name}")
             missing.append(package_name)
     
@@ -256,18 +347,21 @@ def main():
 """)
     
     # Verify dependencies
-    if not verify_dependencies():
+    tray = "--no-tray" not in sys.argv
+    if not verify_dependencies(tray=tray):
         sys.exit(1)
     
-    # Clean old builds
-    clean_build_directories()
+    # Clean old builds (pass --fresh to also drop the PyInstaller cache)
+    fresh = "--fresh" in sys.argv
+    clean_build_directories(fresh=fresh)
     
-    # Build executable
-    if not build_executable():
+    # Build executable (--portable for a single .exe, --no-tray to drop pystray/Pillow)
+    portable = "--portable" in sys.argv
+    if not build_executable(fresh=fresh, portable=portable, tray=tray):
         sys.exit(1)
     
-    # Create distribution package
-    create_distribution_package()
+    # Create distribution package (--release for a compressed ZIP)
+    create_distribution_package(portable=portable, release="--release" in sys.argv)
     
     print("""
 =============================================================
@@ -3,7 +3,9 @@ Icon generation script for TrackerSpotter
 Creates icons for all platforms: PNG (Linux), ICO (Windows), ICNS (macOS)
 """
 
+import hashlib
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 try:
@@ -12,15 +14,26 @@ except ImportError:
     print("ERROR: Pillow is required. Install with: pip install Pillow")
     sys.exit(1)
 
+from _parallel import map_maybe_parallel
+
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent
 ICONS_DIR = PROJECT_ROOT / "icons"
+ICON_CACHE_DIR = ICONS_DIR / ".cache"
 
 # Icon sizes needed for each platform
 WINDOWS_SIZES = [16, 24, 32, 48, 64, 128, 256]
 MACOS_SIZES = [16, 32, 64, 128, 256, 512, 1024]
 LINUX_SIZES = [16, 24, 32, 48, 64, 128, 256, 512]
 
+# Every size rendered by any platform (plus the 32px favicon)
+ALL_SIZES = sorted(set(WINDOWS_SIZES) | set(MACOS_SIZES) | set(LINUX_SIZES) | {32})
+
+# Larger sizes are downscaled from one master; small ones are drawn directly
+# because resampling blurs their 1-2px strokes
+MASTER_SIZE = 1024
+DIRECT_RASTER_MAX = 32
+
 # Color scheme (matching the app's primary color)
 PRIMARY_COLOR = '#2563eb'  # Blue
 SECONDARY_COLOR = '#1e40af'  # Darker blue
@@ -33,10 +46,14 @@ def hex_to_rgb(hex_color: str) -> tuple:
     return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
 
 
+@lru_cache(maxsize=None)
 def create_icon_image(size: int, primary_color: str = PRIMARY_COLOR) -> Image.Image:
     """
     Create a TrackerSpotter icon (target/crosshair design)
     
+    Results are memoized per (size, color), so callers share one Image: save
+    or resize it, but call .copy() before drawing on it.
+    
     Args:
         size: Icon size in pixels
         primary_color: Primary color (hex)
@@ -108,18 +125,87 @@ def create_icon_image(size: int, primary_color: str = PRIMARY_COLOR) -> Image.Im
     return image
 
 
-def create_png_icons():
+def _master_cache_path() -> Path:
+    """Cache file for the master, keyed by the color and this script's source"""
+    h = hashlib.sha256(PRIMARY_COLOR.encode("utf-8"))
+    h.update(Path(__file__).read_bytes())
+    return ICON_CACHE_DIR / f"master_{h.hexdigest()[:16]}.png"
+
+
+def output_paths() -> list:
+    """Every file main() writes"""
+    paths = [ICONS_DIR / f"trackerspotter_{size}x{size}.png" for size in LINUX_SIZES]
+    paths += [ICONS_DIR / name for name in (
+        "trackerspotter.png", "trackerspotter.ico", "trackerspotter.icns",
+        "favicon.ico", "favicon.png",
+    )]
+    return paths
+
+
+def icons_up_to_date() -> bool:
+    """True if the cached master is current and every output is newer than it"""
+    cache_path = _master_cache_path()
+    if not cache_path.exists():
+        return False
+    cache_mtime = cache_path.stat().st_mtime
+    return all(
+        path.exists() and path.stat().st_mtime >= cache_mtime
+        for path in output_paths()
+    )
+
+
+@lru_cache(maxsize=1)
+def _render_master() -> Image.Image:
+    """Draw the icon once at MASTER_SIZE, or load it from icons/.cache/"""
+    cache_path = _master_cache_path()
+    if cache_path.exists():
+        with Image.open(cache_path) as cached:
+            return cached.convert("RGBA")
+    
+    master = create_icon_image(MASTER_SIZE)
+    ICON_CACHE_DIR.mkdir(exist_ok=True)
+    for stale in ICON_CACHE_DIR.glob("master_*.png"):
+        stale.unlink()
+    master.save(cache_path, 'PNG')
+    return master
+
+
+def render_all_sizes() -> dict:
+    """
+    Render the icon at every size in ALL_SIZES
+    
+    Sizes up to DIRECT_RASTER_MAX are rasterized directly; larger ones are
+    LANCZOS downscales of a single master.
+    
+    Returns:
+        Dict of size -> PIL Image
+    """
+    small = [size for size in ALL_SIZES if size <= DIRECT_RASTER_MAX]
+    images = dict(zip(small, map_maybe_parallel(create_icon_image, small)))
+    
+    master = _render_master()
+    for size in ALL_SIZES:
+        if size in images:
+            continue
+        if size == MASTER_SIZE:
+            images[size] = master
+        else:
+            images[size] = master.resize((size, size), Image.Resampling.LANCZOS)
+    return images
+
+
+def create_png_icons(images: dict):
     """Create PNG icons for Linux"""
     print("\nCreating PNG icons for Linux...")
     
     for size in LINUX_SIZES:
-        icon = create_icon_image(size)
+        icon = images[size]
         output_path = ICONS_DIR / f"trackerspotter_{size}x{size}.png"
         icon.save(output_path, 'PNG')
         print(f"   [OK] Created: {output_path.name}")
     
     # Create main icon (256x256)
-    main_icon = create_icon_image(256)
+    main_icon = images[256]
     main_path = ICONS_DIR / "trackerspotter.png"
     main_icon.save(main_path, 'PNG')
     print(f"   [OK] Created: trackerspotter.png (main)")
@@ -127,33 +213,30 @@ def create_png_icons():
     return main_path
 
 
-def create_ico_icon():
+def create_ico_icon(images: dict):
     """Create ICO icon for Windows"""
     print("\nCreating ICO icon for Windows...")
     
-    # Create images for all sizes
-    images = []
-    for size in WINDOWS_SIZES:
-        icon = create_icon_image(size)
-        images.append(icon)
+    # Pre-rendered images for all sizes
+    ico_images = [images[size] for size in WINDOWS_SIZES]
     
     # Save as ICO with multiple sizes
     output_path = ICONS_DIR / "trackerspotter.ico"
     
     # PIL can save multiple sizes in ICO format
     # We save the largest first, then include smaller sizes
-    images[0].save(
+    ico_images[0].save(
         output_path,
         format='ICO',
         sizes=[(s, s) for s in WINDOWS_SIZES],
-        append_images=images[1:]
+        append_images=ico_images[1:]
     )
     
     print(f"   [OK] Created: {output_path.name}")
     return output_path
 
 
-def create_icns_icon():
+def create_icns_icon(images: dict):
     """Create ICNS icon for macOS"""
     print("\nCreating ICNS icon for macOS...")
     
@@ -176,7 +259,7 @@ def create_icns_icon():
     ]
     
     for size, filename in iconset_sizes:
-        icon = create_icon_image(size)
+        icon = images[size]
         icon_path = iconset_dir / filename
         icon.save(icon_path, 'PNG')
         print(f"   [OK] Created: {filename}")
@@ -194,10 +277,14 @@ def create_icns_icon():
         ], check=True)
         print(f"   [OK] Created: {output_path.name}")
         
-        # Clean up iconset directory
-        import shutil
-        shutil.rmtree(iconset_dir)
-        print("   [OK] Cleaned up iconset directory")
+        # Clean up iconset directory (we know exactly which files we wrote)
+        try:
+            for _, filename in iconset_sizes:
+                (iconset_dir / filename).unlink(missing_ok=True)
+            iconset_dir.rmdir()
+            print("   [OK] Cleaned up iconset directory")
+        except OSError as e:
+            print(f"   [WARNING] Could not remove iconset directory: {e}")
         
     except FileNotFoundError:
         print(f"   [INFO] iconutil not found (not on macOS)")
@@ -207,7 +294,7 @@ def create_icns_icon():
         # Create a basic ICNS-like file using Pillow (limited support)
         # This won't be a proper ICNS but can serve as placeholder
         try:
-            largest = create_icon_image(512)
+            largest = images[512]
             largest.save(output_path, 'PNG')  # Save as PNG with .icns extension as fallback
             print(f"   [INFO] Created placeholder: {output_path.name} (convert on macOS)")
         except Exception:
@@ -219,12 +306,12 @@ def create_icns_icon():
     return output_path
 
 
-def create_favicon():
+def create_favicon(images: dict):
     """Create favicon for web UI"""
     print("\nCreating favicon for web UI...")
     
     # Create 32x32 favicon
-    icon = create_icon_image(32)
+    icon = images[32]
     output_path = ICONS_DIR / "favicon.ico"
     icon.save(output_path, 'ICO')
     print(f"   [OK] Created: {output_path.name}")
@@ -249,11 +336,17 @@ def main():
     ICONS_DIR.mkdir(exist_ok=True)
     print(f"Icons directory: {ICONS_DIR}")
     
-    # Generate icons for each platform
-    create_png_icons()
-    create_ico_icon()
-    create_icns_icon()
-    create_favicon()
+    # Nothing to do if the design is unchanged since the last run (--force to redo)
+    if "--force" not in sys.argv and icons_up_to_date():
+        print("\n[OK] Icons are up to date")
+        return
+    
+    # Render each distinct size once, then write the icons for each platform
+    images = render_all_sizes()
+    create_png_icons(images)
+    create_ico_icon(images)
+    create_icns_icon(images)
+    create_favicon(images)
     
     print("""
 =============================================================
@@ -0,0 +1,53 @@
+# -*- mode: python ; coding: utf-8 -*-
+# PyInstaller spec for the Windows console (debug) build.
+# Rendered by build_scripts/build_console.py: each double-underscore placeholder is
+# replaced with a Python literal before PyInstaller runs.
+import os
+
+from PyInstaller.utils.hooks import collect_submodules
+
+PROJECT_ROOT = __PROJECT_ROOT__
+STATIC_DIR = __STATIC_DIR__
+
+hiddenimports = [
+    # Core dependencies
+    'flask',
+    'bencodepy',
+    # WebSocket support
+    'simple_websocket',
+    'h11',
+]
+# Flask-SocketIO and dependencies (whole subtrees, walked once)
+for package in ('flask_socketio', 'socketio', 'engineio', 'wsproto'):
+    hiddenimports += collect_submodules(package)
+
+a = Analysis(
+    [os.path.join(PROJECT_ROOT, 'trackerspotter.py')],
+    pathex=[],
+    binaries=[],
+    datas=[(STATIC_DIR, 'trackerspotter/static')],
+    hiddenimports=hiddenimports,
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=[],
+    noarchive=False,
+)
+pyz = PYZ(a.pure)
+
+# Single-file executable
+exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.datas,
+    [],
+    name='TrackerSpotter_Console',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    runtime_tmpdir=None,
+    console=True,  # Keep console window visible
+)
@@ -0,0 +1,75 @@
+# -*- mode: python ; coding: utf-8 -*-
+# PyInstaller spec for the macOS build.
+# Rendered by build_scripts/build_macos.py: each double-underscore placeholder is
+# replaced with a Python literal before PyInstaller runs.
+import os
+
+from PyInstaller.utils.hooks import collect_submodules
+
+PROJECT_ROOT = __PROJECT_ROOT__
+STATIC_DIR = __STATIC_DIR__
+ICON = __ICON__
+VERSION = __VERSION__
+BUNDLE_ID = __BUNDLE_ID__
+
+hiddenimports = [
+    # Core dependencies
+    'flask',
+    'bencodepy',
+    # WebSocket support
+    'simple_websocket',
+    'h11',
+    # System tray support
+    'pystray',
+    'PIL',
+    'PIL.Image',
+    'PIL.ImageDraw',
+]
+# Flask-SocketIO and dependencies (whole subtrees, walked once)
+for package in ('flask_socketio', 'socketio', 'engineio', 'wsproto'):
+    hiddenimports += collect_submodules(package)
+
+a = Analysis(
+    [os.path.join(PROJECT_ROOT, 'trackerspotter.py')],
+    pathex=[],
+    binaries=[],
+    datas=[(STATIC_DIR, 'trackerspotter/static')],
+    hiddenimports=hiddenimports,
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=[],
+    noarchive=False,
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='TrackerSpotter',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=True,
+    console=False,  # Windowed .app (no terminal window)
+    argv_emulation=False,
+    icon=ICON,
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    name='TrackerSpotter',
+)
+app = BUNDLE(
+    coll,
+    name='TrackerSpotter.app',
+    icon=ICON,
+    bundle_identifier=BUNDLE_ID,
+    version=VERSION,
+)
@@ -0,0 +1,97 @@
+# -*- mode: python ; coding: utf-8 -*-
+# PyInstaller spec for the Windows build.
+# Rendered by build_scripts/build_windows.py: each double-underscore placeholder is
+# replaced with a Python literal before PyInstaller runs.
+import os
+
+from PyInstaller.utils.hooks import collect_submodules
+
+PROJECT_ROOT = __PROJECT_ROOT__
+STATIC_DIR = __STATIC_DIR__
+ICON = __ICON__
+PORTABLE = __PORTABLE__  # Single self-extracting .exe instead of a folder
+TRAY = __TRAY__  # Bundle pystray/Pillow for the system tray icon
+UPX = __UPX__  # False when TRACKERSPOTTER_NO_UPX is set
+UPX_EXCLUDE = __UPX_EXCLUDE__
+
+hiddenimports = [
+    # Core dependencies
+    'flask',
+    'bencodepy',
+    # WebSocket support
+    'simple_websocket',
+    'h11',
+]
+# Flask-SocketIO and dependencies (whole subtrees, so dynamically
+# imported submodules such as engineio.async_drivers.* are never missed)
+for package in ('flask_socketio', 'socketio', 'engineio', 'wsproto'):
+    hiddenimports += collect_submodules(package)
+
+# Standard library parts a Flask app never uses
+excludes = ['tkinter', 'unittest', 'pydoc_data']
+
+# System tray support (tray.py falls back gracefully when it is missing)
+if TRAY:
+    hiddenimports += ['pystray', 'PIL', 'PIL.Image', 'PIL.ImageDraw']
+else:
+    excludes += ['pystray', 'PIL']
+
+a = Analysis(
+    [os.path.join(PROJECT_ROOT, 'trackerspotter.py')],
+    pathex=[],
+    binaries=[],
+    datas=[(STATIC_DIR, 'trackerspotter/static')],
+    hiddenimports=hiddenimports,
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=excludes,
+    noarchive=False,
+    # Bytecode compiled as with python -OO: no docstrings or asserts
+    # (needs PyInstaller 6.6+)
+    optimize=2,
+)
+pyz = PYZ(a.pure)
+
+# No console window (GUI app); without the tray the console is the only way
+# to stop the server, so keep it
+if PORTABLE:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        a.binaries,
+        a.datas,
+        [],
+        name='TrackerSpotter',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=False,
+        upx=UPX,
+        upx_exclude=UPX_EXCLUDE,
+        runtime_tmpdir=None,
+        console=not TRAY,
+        icon=ICON,
+    )
+else:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        [],
+        exclude_binaries=True,
+        name='TrackerSpotter',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=False,
+        upx=UPX,
+        console=not TRAY,
+        icon=ICON,
+    )
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.datas,
+        strip=False,
+        upx=UPX,
+        upx_exclude=UPX_EXCLUDE,
+        name='TrackerSpotter',
+    )
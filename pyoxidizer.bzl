@@ -0,0 +1,54 @@
+# PyOxidizer configuration for TrackerSpotter release builds
+#
+# Pure-Python modules are embedded in the executable and imported from
+# memory, so there is no per-launch extraction to a temp directory (as with
+# PyInstaller --onefile). Built by build_scripts/build_pyoxidizer.py.
+
+def make_exe():
+    dist = default_python_distribution()
+
+    policy = dist.make_python_packaging_policy()
+    policy.resources_location = "in-memory"
+    # Extension modules that cannot be loaded from memory (Pillow, markupsafe)
+    policy.resources_location_fallback = "filesystem-relative:lib"
+
+    python_config = dist.make_python_interpreter_config()
+    python_config.run_command = "from trackerspotter.main import main; main()"
+    # tracker_server.py locates static/ via sys._MEIPASS when frozen
+    python_config.sys_frozen = True
+    python_config.sys_meipass = True
+
+    exe = dist.to_python_executable(
+        name = "trackerspotter",
+        packaging_policy = policy,
+        config = python_config,
+    )
+
+    exe.add_python_resources(exe.pip_install(["-r", "requirements.txt"]))
+
+    # Flask derives the app root from the module's __file__, so the
+    # application package itself stays on the filesystem
+    for resource in exe.read_package_root(path = CWD + "/src", packages = ["trackerspotter"]):
+        resource.add_location = "filesystem-relative:lib"
+        exe.add_python_resource(resource)
+
+    return exe
+
+def make_static():
+    # Installed as <install dir>/trackerspotter/static, next to the executable
+    return glob(
+        include = [CWD + "/src/trackerspotter/static/**/*"],
+        strip_prefix = CWD + "/src/",
+    )
+
+def make_install(exe, static):
+    files = FileManifest()
+    files.add_python_resource(".", exe)
+    files.add_manifest(static)
+    return files
+
+register_target("exe", make_exe)
+register_target("static", make_static)
+register_target("install", make_install, depends = ["exe", "static"], default = True)
+
+resolve_targets()
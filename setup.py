@@ -4,14 +4,25 @@ Setup configuration for package distribution
 """
 
 from setuptools import setup, find_packages
+from functools import lru_cache
 from pathlib import Path
+import os
 import re
 
+_VERSION_RE = re.compile(r'''__version__\s*=\s*["']([^"']+)["']''')
+
 # Read version from __init__.py (single source of truth)
+# Mirrors build_scripts/_common.py, which is not shipped in the sdist
+@lru_cache(maxsize=1)
 def get_version():
+    override = os.environ.get("TRACKERSPOTTER_VERSION")
+    if override:
+        return override
     init_file = Path(__file__).parent / "src" / "trackerspotter" / "__init__.py"
-    content = init_file.read_text(encoding="utf-8")
-    match = re.search(r'__version__\s*=\s*["\']([^"\']+)["\']', content)
+    # __version__ sits near the top, so try the first KB before reading it all
+    with init_file.open("rb") as f:
+        head = f.read(1024).decode("utf-8", "replace")
+    match = _VERSION_RE.search(head) or _VERSION_RE.search(init_file.read_text(encoding="utf-8"))
     return match.group(1) if match else "0.0.0"
 
 # Read the README for long description
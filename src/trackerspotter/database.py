@@ -2,20 +2,102 @@
 Database operations for TrackerSpotter using SQLite
 """
 
+import logging
+import os
+import queue
 import sqlite3
 import sys
+import threading
+import time
+from collections import deque
+from functools import lru_cache, wraps
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 from contextlib import contextmanager
 
 from .models import AnnounceEvent
 
+logger = logging.getLogger(__name__)
 
+# Per-connection settings: commits in WAL mode only fsync at checkpoints
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+)
+
+# Idle connections kept open for reuse; extra ones are closed on release
+MAX_IDLE_CONNECTIONS = 8
+
+# Rows removed per transaction by delete_old_announces
+DELETE_CHUNK_SIZE = 1000
+
+# Queued announces are written in transactions of up to this many rows, after
+# waiting at most WRITE_BATCH_WAIT seconds for a batch to fill
+WRITE_BATCH_SIZE = 500
+WRITE_BATCH_WAIT = 0.02
+
+# A batch that hits a busy/locked database is retried this many times, with a
+# growing delay, before it is written row by row
+WRITE_RETRIES = 3
+WRITE_RETRY_DELAY = 0.1
+
+# Seconds that dashboard aggregates are reused between writes
+CACHE_TTL = 2.0
+
+# Timestamps are stored as INTEGER microseconds since this (naive, local) epoch
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Dashboard event list row, built by SQLite's json_object(). The timestamp is
+# formatted like from_timestamp_us(): always with six microsecond digits.
+EVENT_LIST_JSON = """json_object(
+    'id', id,
+    'timestamp', strftime('%Y-%m-%dT%H:%M:%S', timestamp / 1000000, 'unixepoch')
+        || printf('.%06d', timestamp % 1000000),
+    'info_hash_hex', info_hash_hex,
+    'client_ip', client_ip,
+    'client_port', client_port,
+    'uploaded', uploaded,
+    'downloaded', downloaded,
+    'left', left,
+    'event', event,
+    'user_agent', user_agent,
+    -- json('true') makes a JSON boolean, matching the live broadcast
+    'is_http', json(CASE WHEN COALESCE(raw_headers, '') != '' THEN 'true' ELSE 'false' END)
+)"""
+
+ANNOUNCES_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS announces (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp INTEGER NOT NULL,
+        info_hash_hex TEXT NOT NULL,
+        peer_id TEXT NOT NULL,
+        client_ip TEXT NOT NULL,
+        client_port INTEGER NOT NULL,
+        uploaded INTEGER NOT NULL,
+        downloaded INTEGER NOT NULL,
+        left INTEGER NOT NULL,
+        event TEXT NOT NULL,
+        user_agent TEXT,
+        numwant INTEGER,
+        compact INTEGER,
+        key TEXT,
+        raw_query TEXT,
+        raw_headers TEXT
+    )
+"""
+
+
+@lru_cache(maxsize=None)
 def get_app_data_dir() -> Path:
     """
     Get the appropriate application data directory for the current platform.
     
+    The directory is created on the first call; later calls reuse the result.
+    
     Returns:
         Path to the application data directory
     """
@@ -30,19 +112,72 @@ def get_app_data_dir() -> Path:
         base = Path.home() / ".local" / "share"
     
     app_dir = base / "TrackerSpotter"
-    app_dir.mkdir(parents=True, exist_ok=True)
+    os.makedirs(app_dir, exist_ok=True)
     return app_dir
 
 
+def to_timestamp_us(value: datetime) -> int:
+    """Convert a datetime to the stored INTEGER timestamp"""
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def from_timestamp_us(value: Optional[int]) -> Optional[str]:
+    """Convert a stored INTEGER timestamp back to an ISO 8601 string"""
+    if value is None:
+        return None
+    # Keep the microseconds even when zero, to match EVENT_LIST_JSON
+    return (_EPOCH + timedelta(microseconds=value)).isoformat(timespec='microseconds')
+
+
+def _row_to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+    """Convert an announces row to a dictionary with an ISO timestamp"""
+    data = dict(row)
+    data['timestamp'] = from_timestamp_us(data['timestamp'])
+    return data
+
+
+def cached_read(method):
+    """
+    Cache a Database read method for CACHE_TTL seconds
+    
+    Entries are keyed on the write generation, so any write makes them stale.
+    """
+    @wraps(method)
+    def wrapper(self, *args):
+        # Read the generation before querying so a concurrent write is never
+        # hidden behind a result cached under the newer generation
+        key = (method.__name__, args, self._write_generation)
+        cached = self._read_cache.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self._cache_ttl:
+            return cached[1]
+        
+        result = method(self, *args)
+        self._read_cache[key] = (now, result)
+        return result
+    return wrapper
+
+
 class Database:
     """SQLite database manager for announce events"""
     
-    def __init__(self, db_path: str = None):
+    # One constant text, so every insert hits the connection's statement cache.
+    # Ids are assigned by _reserve_ids() so queued events know theirs up front.
+    _INSERT_SQL = """
+        INSERT INTO announces (
+            id, timestamp, info_hash_hex, peer_id,
+            client_ip, client_port, uploaded, downloaded, left,
+            event, user_agent, numwant, compact, key, raw_query, raw_headers
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    def __init__(self, db_path: str = None, cache_ttl: float = CACHE_TTL):
         """
         Initialize database connection
         
         Args:
             db_path: Path to SQLite database file (default: platform-appropriate location)
+            cache_ttl: Seconds to reuse stats/counts results while nothing is written
         """
         if db_path is None:
             try:
@@ -53,13 +188,45 @@ class Database:
                 db_path = "trackerspotter.db"
         
         self.db_path = db_path
+        # HTTP and UDP requests each run on a short-lived thread, so connections
+        # are pooled rather than kept per thread (deque append/pop are atomic)
+        self._idle_connections = deque()
+        # Dashboard queries use a separate pool of query_only connections
+        self._idle_readers = deque()
+        self._cache_ttl = cache_ttl
+        self._read_cache: Dict[tuple, tuple] = {}
+        self._write_generation = 0
         self._create_tables()
+        self._enable_wal()
+        
+        # Announce ids are handed out here rather than by AUTOINCREMENT
+        self._id_lock = threading.Lock()
+        self._next_id = self._load_next_id()
+        
+        # Tracker requests queue their inserts for a single writer thread
+        self._write_queue = queue.Queue()
+        self._writer = threading.Thread(target=self._writer_loop, name="announce-writer", daemon=True)
+        self._writer.start()
     
-    @contextmanager
-    def get_connection(self):
-        """Context manager for database connections"""
-        conn = sqlite3.connect(self.db_path)
+    def _connect(self, readonly: bool = False) -> sqlite3.Connection:
+        """Open and configure a new connection"""
+        # Pooled connections live for the whole process, so their prepared
+        # statements do too; leave room for the dynamic filter queries
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
         conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        if readonly:
+            conn.execute("PRAGMA query_only=1")
+        return conn
+    
+    @contextmanager
+    def _pooled(self, pool: deque, readonly: bool):
+        """Take a connection from a pool and put it back afterwards"""
+        try:
+            conn = pool.pop()
+        except IndexError:
+            conn = self._connect(readonly)
         try:
             yield conn
             conn.commit()
@@ -67,32 +234,42 @@ class Database:
             conn.rollback()
             raise
         finally:
-            conn.close()
+            if len(pool) < MAX_IDLE_CONNECTIONS:
+                pool.append(conn)
+            else:
+                conn.close()
+    
+    def get_connection(self):
+        """Context manager for database connections (reused from the pool)"""
+        return self._pooled(self._idle_connections, readonly=False)
+    
+    def get_read_connection(self):
+        """Context manager for read-only (query_only) connections"""
+        return self._pooled(self._idle_readers, readonly=True)
+    
+    def close(self):
+        """Write any queued announces, then close all pooled connections"""
+        if self._writer.is_alive():
+            self._write_queue.put(None)
+            self._writer.join(timeout=5.0)
+        
+        if self._idle_connections:
+            try:
+                # Refresh planner statistics if the data changed enough
+                self._idle_connections[-1].execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
+        for pool in (self._idle_connections, self._idle_readers):
+            while pool:
+                try:
+                    pool.pop().close()
+                except IndexError:
+                    break
     
     def _create_tables(self):
         """Create database tables if they don't exist"""
         with self.get_connection() as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS announces (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp TEXT NOT NULL,
-                    info_hash BLOB NOT NULL,
-                    info_hash_hex TEXT NOT NULL,
-                    peer_id TEXT NOT NULL,
-                    client_ip TEXT NOT NULL,
-                    client_port INTEGER NOT NULL,
-                    uploaded INTEGER NOT NULL,
-                    downloaded INTEGER NOT NULL,
-                    left INTEGER NOT NULL,
-                    event TEXT NOT NULL,
-                    user_agent TEXT,
-                    numwant INTEGER,
-                    compact INTEGER,
-                    key TEXT,
-                    raw_query TEXT,
-                    raw_headers TEXT
-                )
-            """)
+            conn.execute(ANNOUNCES_TABLE_SQL)
             
             # Migration: Add raw_headers column if it doesn't exist (for existing databases)
             try:
@@ -100,21 +277,253 @@ class Database:
             except sqlite3.OperationalError:
                 pass  # Column already exists
             
+            # Migration: ISO TEXT timestamps (and the old info_hash column)
+            column_types = {
+                row['name']: row['type'] for row in conn.execute("PRAGMA table_info(announces)")
+            }
+            if column_types['timestamp'] == 'TEXT':
+                self._migrate_integer_timestamps(conn)
+            
             # Create indices for faster queries
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_timestamp 
                 ON announces(timestamp DESC)
             """)
             
+            # Per-torrent and per-event views walk these already sorted by
+            # time and stop at LIMIT; they replace the single-column indices
+            new_indices = not conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'idx_hash_ts'"
+            ).fetchone()
+            
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_hash_ts
+                ON announces(info_hash_hex, timestamp DESC)
+            """)
+            
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_event_ts
+                ON announces(event, timestamp DESC)
+            """)
+            
+            conn.execute("DROP INDEX IF EXISTS idx_info_hash")
+            conn.execute("DROP INDEX IF EXISTS idx_event")
+            
+            if new_indices:
+                conn.execute("ANALYZE announces")
+            
+            self._create_summary_tables(conn)
+            self._fts_enabled = self._create_search_index(conn)
+    
+    def _migrate_integer_timestamps(self, conn: sqlite3.Connection):
+        """
+        Rebuild announces with INTEGER timestamps
+        
+        Column types cannot be altered in place, so the table is copied. The
+        copy also leaves out the info_hash column (a duplicate of info_hash_hex)
+        on SQLite versions too old for DROP COLUMN.
+        
+        Args:
+            conn: Open connection
+        """
+        if not conn.in_transaction:
+            conn.execute("BEGIN")
+        
+        conn.execute("ALTER TABLE announces RENAME TO announces_old")
+        conn.execute(ANNOUNCES_TABLE_SQL)
+        # Timestamps were naive isoformat() strings; %s reads them as-is and
+        # the microseconds (if any) follow the seconds at character 21
+        conn.execute("""
+            INSERT INTO announces (
+                id, timestamp, info_hash_hex, peer_id,
+                client_ip, client_port, uploaded, downloaded, left,
+                event, user_agent, numwant, compact, key, raw_query, raw_headers
+            )
+            SELECT
+                id,
+                CAST(strftime('%s', timestamp) AS INTEGER) * 1000000
+                    + CAST(substr(timestamp, 21, 6) AS INTEGER),
+                info_hash_hex, peer_id,
+                client_ip, client_port, uploaded, downloaded, left,
+                event, user_agent, numwant, compact, key, raw_query, raw_headers
+            FROM announces_old
+        """)
+        # Dropping the old table also drops its indices and triggers
+        conn.execute("DROP TABLE announces_old")
+        
+        # Summaries hold timestamps too; they are rebuilt from the new table
+        conn.execute("DROP TABLE IF EXISTS torrents_summary")
+        conn.execute("DROP TABLE IF EXISTS event_counts")
+    
+    def _create_summary_tables(self, conn: sqlite3.Connection):
+        """
+        Create per-torrent and per-event counters maintained by triggers
+        
+        These replace GROUP BY scans of the whole announces table.
+        
+        Args:
+            conn: Open connection
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'torrents_summary'"
+        ).fetchone()
+        
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS torrents_summary (
+                info_hash_hex TEXT PRIMARY KEY,
+                count INTEGER NOT NULL,
+                last_seen INTEGER NOT NULL
+            )
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_torrents_last_seen
+            ON torrents_summary(last_seen DESC)
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS event_counts (
+                event TEXT PRIMARY KEY,
+                count INTEGER NOT NULL
+            )
+        """)
+        
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS announces_summary_insert AFTER INSERT ON announces BEGIN
+                INSERT INTO torrents_summary(info_hash_hex, count, last_seen)
+                VALUES (new.info_hash_hex, 1, new.timestamp)
+                ON CONFLICT(info_hash_hex) DO UPDATE
+                SET count = count + 1, last_seen = MAX(last_seen, excluded.last_seen);
+                INSERT INTO event_counts(event, count) VALUES (new.event, 1)
+                ON CONFLICT(event) DO UPDATE SET count = count + 1;
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS announces_summary_delete AFTER DELETE ON announces BEGIN
+                UPDATE torrents_summary SET count = count - 1 WHERE info_hash_hex = old.info_hash_hex;
+                DELETE FROM torrents_summary WHERE info_hash_hex = old.info_hash_hex AND count <= 0;
+                UPDATE event_counts SET count = count - 1 WHERE event = old.event;
+                DELETE FROM event_counts WHERE event = old.event AND count <= 0;
+            END
+        """)
+        
+        # Migration: summarize rows written before the summary tables existed
+        if not exists:
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_info_hash 
-                ON announces(info_hash_hex)
+                INSERT INTO torrents_summary(info_hash_hex, count, last_seen)
+                SELECT info_hash_hex, COUNT(*), MAX(timestamp)
+                FROM announces
+                GROUP BY info_hash_hex
+            """)
+            conn.execute("""
+                INSERT INTO event_counts(event, count)
+                SELECT event, COUNT(*)
+                FROM announces
+                GROUP BY event
             """)
+    
+    def _create_search_index(self, conn: sqlite3.Connection) -> bool:
+        """
+        Create the FTS5 index used by the search filter
+        
+        The trigram tokenizer matches any substring of 3+ characters, like the
+        LIKE '%...%' search it replaces, but through an index.
+        
+        Args:
+            conn: Open connection
             
+        Returns:
+            True if the index is available (needs SQLite 3.34+ with FTS5)
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'announces_fts'"
+        ).fetchone()
+        
+        try:
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_event 
-                ON announces(event)
+                CREATE VIRTUAL TABLE IF NOT EXISTS announces_fts USING fts5(
+                    info_hash_hex, client_ip, user_agent,
+                    content='announces', content_rowid='id', tokenize='trigram'
+                )
             """)
+        except sqlite3.OperationalError:
+            return False  # No FTS5 or no trigram tokenizer; search uses LIKE
+        
+        # Keep the index in sync with the announces table
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS announces_fts_insert AFTER INSERT ON announces BEGIN
+                INSERT INTO announces_fts(rowid, info_hash_hex, client_ip, user_agent)
+                VALUES (new.id, new.info_hash_hex, new.client_ip, new.user_agent);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS announces_fts_delete AFTER DELETE ON announces BEGIN
+                INSERT INTO announces_fts(announces_fts, rowid, info_hash_hex, client_ip, user_agent)
+                VALUES ('delete', old.id, old.info_hash_hex, old.client_ip, old.user_agent);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS announces_fts_update AFTER UPDATE ON announces BEGIN
+                INSERT INTO announces_fts(announces_fts, rowid, info_hash_hex, client_ip, user_agent)
+                VALUES ('delete', old.id, old.info_hash_hex, old.client_ip, old.user_agent);
+                INSERT INTO announces_fts(rowid, info_hash_hex, client_ip, user_agent)
+                VALUES (new.id, new.info_hash_hex, new.client_ip, new.user_agent);
+            END
+        """)
+        
+        # Migration: index rows written before the FTS table existed
+        if not exists:
+            conn.execute("INSERT INTO announces_fts(announces_fts) VALUES ('rebuild')")
+        return True
+    
+    def _invalidate_cache(self):
+        """Drop cached reads after a committed write"""
+        self._write_generation += 1
+        self._read_cache.clear()
+    
+    def _enable_wal(self):
+        """Switch the database file to write-ahead logging (persists in the file)"""
+        with self.get_connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA wal_autocheckpoint=1000")
+    
+    def _load_next_id(self) -> int:
+        """First unused announce id (AUTOINCREMENT never reuses deleted ids)"""
+        with self.get_read_connection() as conn:
+            row = conn.execute("""
+                SELECT MAX(
+                    COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'announces'), 0),
+                    COALESCE((SELECT MAX(id) FROM announces), 0)
+                )
+            """).fetchone()
+        return row[0] + 1
+    
+    def _reserve_ids(self, count: int) -> int:
+        """Reserve count consecutive announce ids and return the first one"""
+        with self._id_lock:
+            first_id = self._next_id
+            self._next_id += count
+        return first_id
+    
+    @staticmethod
+    def _announce_row(announce_id: int, event: AnnounceEvent) -> tuple:
+        """Column values for inserting an AnnounceEvent"""
+        return (
+            announce_id,
+            to_timestamp_us(event.timestamp),
+            event.info_hash_hex,
+            event.peer_id,
+            event.client_ip,
+            event.client_port,
+            event.uploaded,
+            event.downloaded,
+            event.left,
+            event.event,
+            event.user_agent,
+            event.numwant,
+            event.compact,
+            event.key,
+            event.raw_query,
+            event.raw_headers
+        )
     
     def insert_announce(self, event: AnnounceEvent) -> int:
         """
@@ -126,106 +535,349 @@ class Database:
         Returns:
             ID of inserted row
         """
+        return self.insert_announces_batch([event])[0]
+    
+    def insert_announces_batch(self, events: List[AnnounceEvent]) -> List[int]:
+        """
+        Insert several announce events in a single transaction
+        
+        Args:
+            events: AnnounceEvent objects
+            
+        Returns:
+            IDs of inserted rows, in the same order as events
+        """
+        if not events:
+            return []
+        
+        first_id = self._reserve_ids(len(events))
+        rows = [self._announce_row(first_id + i, event) for i, event in enumerate(events)]
         with self.get_connection() as conn:
-            cursor = conn.execute("""
-                INSERT INTO announces (
-                    timestamp, info_hash, info_hash_hex, peer_id,
-                    client_ip, client_port, uploaded, downloaded, left,
-                    event, user_agent, numwant, compact, key, raw_query, raw_headers
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                event.timestamp.isoformat(),
-                event.info_hash,  # Store as hex string directly
-                event.info_hash_hex,
-                event.peer_id,
-                event.client_ip,
-                event.client_port,
-                event.uploaded,
-                event.downloaded,
-                event.left,
-                event.event,
-                event.user_agent,
-                event.numwant,
-                event.compact,
-                event.key,
-                event.raw_query,
-                event.raw_headers
-            ))
-            return cursor.lastrowid
-    
-    def get_recent_announces(self, limit: int = 100) -> List[Dict[str, Any]]:
+            conn.executemany(self._INSERT_SQL, rows)
+        
+        self._invalidate_cache()
+        return [row[0] for row in rows]
+    
+    def queue_announce(self, event: AnnounceEvent) -> int:
+        """
+        Queue an announce event for the background writer
+        
+        The row is committed shortly afterwards, together with any other
+        events queued in the meantime, so the caller does not wait on SQLite.
+        Until then the id is only reserved; flush_writes() waits for the commit.
+        
+        Args:
+            event: AnnounceEvent object
+            
+        Returns:
+            ID the row will be stored under
+        """
+        announce_id = self._reserve_ids(1)
+        self._write_queue.put(self._announce_row(announce_id, event))
+        return announce_id
+    
+    def flush_writes(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until every announce queued so far has been committed
+        
+        Args:
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            True if the queue was flushed in time
+        """
+        if not self._writer.is_alive():
+            return True
+        done = threading.Event()
+        self._write_queue.put(done)
+        return done.wait(timeout)
+    
+    def _writer_loop(self):
+        """Commit queued announce rows in batches until close() is called"""
+        while True:
+            row = self._write_queue.get()
+            if row is None:
+                return
+            
+            # Collect whatever else arrives while the batch is filling. A flush
+            # marker (threading.Event) ends the batch early and is set once
+            # everything queued before it is written.
+            batch = []
+            flushed = []
+            stopping = False
+            deadline = time.monotonic() + WRITE_BATCH_WAIT
+            while True:
+                if row is None:
+                    stopping = True
+                    break
+                if isinstance(row, threading.Event):
+                    flushed.append(row)
+                    break
+                batch.append(row)
+                if len(batch) >= WRITE_BATCH_SIZE:
+                    break
+                try:
+                    row = self._write_queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+            
+            if batch:
+                self._write_rows(batch)
+            for done in flushed:
+                done.set()
+            
+            if stopping:
+                return
+    
+    def _write_rows(self, rows: List[tuple]):
+        """
+        Commit a batch of queued announce rows
+        
+        Busy/locked errors are retried; if the batch still cannot be written,
+        rows are inserted one by one so only the offending ones are lost.
+        """
+        for attempt in range(1, WRITE_RETRIES + 1):
+            try:
+                with self.get_connection() as conn:
+                    conn.executemany(self._INSERT_SQL, rows)
+                self._invalidate_cache()
+                return
+            except sqlite3.OperationalError as e:
+                logger.warning(f"Writing {len(rows)} queued announce(s) failed "
+                               f"(attempt {attempt}/{WRITE_RETRIES}): {e}")
+                time.sleep(WRITE_RETRY_DELAY * attempt)
+            except sqlite3.Error as e:
+                logger.warning(f"Writing {len(rows)} queued announce(s) failed: {e}")
+                break
+        
+        lost = []
+        for row in rows:
+            try:
+                with self.get_connection() as conn:
+                    conn.execute(self._INSERT_SQL, row)
+            except sqlite3.Error as e:
+                lost.append(row[0])
+                last_error = e
+        self._invalidate_cache()
+        
+        if lost:
+            logger.error(f"Dropped {len(lost)} queued announce(s) that could not be "
+                         f"written (ids {lost[0]}..{lost[-1]}): {last_error}")
+    
+    def get_recent_announces(self, limit: int = 100,
+                             before_timestamp: Optional[str] = None,
+                             before_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get most recent announce events
         
         Args:
             limit: Maximum number of events to return
+            before_timestamp: Only return events older than this timestamp
+                (the last timestamp of the previous page)
+            before_id: Id of the last event of the previous page; events with
+                the same timestamp and a lower id are returned too
             
         Returns:
             List of announce event dictionaries
         """
-        with self.get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT * FROM announces
-                ORDER BY timestamp DESC
-                LIMIT ?
-            """, (limit,))
+        return list(self.iter_recent_announces(limit, before_timestamp, before_id))
+    
+    def iter_recent_announces(self, limit: int = 100,
+                              before_timestamp: Optional[str] = None,
+                              before_id: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the most recent announce events one row at a time
+        
+        The read connection is held until the generator is exhausted or closed,
+        so rows are streamed from the cursor instead of fetched all at once.
+        
+        Args:
+            limit: Maximum number of events to yield
+            before_timestamp: Only yield events older than this timestamp
+            before_id: Id of the last event of the previous page (see
+                get_recent_announces)
             
-            return [dict(row) for row in cursor.fetchall()]
+        Yields:
+            Announce event dictionaries, newest first
+        """
+        query, params = self._filter_query(
+            "*", limit=limit, before_timestamp=before_timestamp, before_id=before_id
+        )
+        with self.get_read_connection() as conn:
+            cursor = conn.execute(query, params)
+            try:
+                for row in cursor:
+                    yield _row_to_dict(row)
+            finally:
+                # Reset the statement if the consumer stopped early
+                cursor.close()
     
-    def get_announces_by_filter(
+    def _filter_query(
         self,
+        columns: str,
         event_type: Optional[str] = None,
         info_hash: Optional[str] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
         search: Optional[str] = None,
-        limit: int = 1000
-    ) -> List[Dict[str, Any]]:
+        limit: int = 1000,
+        before_timestamp: Optional[str] = None,
+        before_id: Optional[int] = None
+    ) -> Tuple[str, list]:
         """
-        Get announces with optional filters
+        Build the SELECT for the event filters (see get_announces_by_filter)
         
-        Args:
-            event_type: Filter by event type (started, completed, stopped, or empty for updates)
-            info_hash: Filter by info hash (hex)
-            start_time: Filter events after this time
-            end_time: Filter events before this time
-            search: Search in info_hash_hex, client_ip, or user_agent
-            limit: Maximum results
-            
         Returns:
-            List of announce event dictionaries
+            Tuple of (SQL, parameters)
         """
-        query = "SELECT * FROM announces WHERE 1=1"
+        clauses = []
         params = []
         
         if event_type is not None:
-            query += " AND event = ?"
+            clauses.append("event = ?")
             params.append(event_type)
         
         if info_hash:
-            query += " AND info_hash_hex = ?"
+            clauses.append("info_hash_hex = ?")
             params.append(info_hash)
         
         if start_time:
-            query += " AND timestamp >= ?"
-            params.append(start_time.isoformat())
+            clauses.append("timestamp >= ?")
+            params.append(to_timestamp_us(start_time))
         
         if end_time:
-            query += " AND timestamp <= ?"
-            params.append(end_time.isoformat())
+            clauses.append("timestamp <= ?")
+            params.append(to_timestamp_us(end_time))
         
-        if search:
-            query += " AND (info_hash_hex LIKE ? OR client_ip LIKE ? OR user_agent LIKE ?)"
+        if search and self._fts_enabled and len(search) >= 3:
+            # Quote as an FTS5 string so operators and punctuation match literally
+            clauses.append("id IN (SELECT rowid FROM announces_fts WHERE announces_fts MATCH ?)")
+            params.append('"' + search.replace('"', '""') + '"')
+        elif search:
+            # Trigrams need at least 3 characters
+            clauses.append("(info_hash_hex LIKE ? OR client_ip LIKE ? OR user_agent LIKE ?)")
             search_pattern = f"%{search}%"
             params.extend([search_pattern, search_pattern, search_pattern])
         
-        query += " ORDER BY timestamp DESC LIMIT ?"
+        if before_timestamp:
+            before_us = to_timestamp_us(datetime.fromisoformat(before_timestamp))
+            if before_id is not None:
+                # Timestamps are not unique, so the cursor is (timestamp, id);
+                # rows sharing the boundary timestamp continue on the next page
+                clauses.append("(timestamp, id) < (?, ?)")
+                params.extend([before_us, before_id])
+            else:
+                clauses.append("timestamp < ?")
+                params.append(before_us)
+        
+        # Each combination of filters always produces the same text, so the
+        # prepared statement is reused from the connection's cache
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        query = f"SELECT {columns} FROM announces{where} ORDER BY timestamp DESC, id DESC LIMIT ?"
         params.append(limit)
+        return query, params
+    
+    def get_announces_by_filter(
+        self,
+        event_type: Optional[str] = None,
+        info_hash: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        search: Optional[str] = None,
+        limit: int = 1000,
+        before_timestamp: Optional[str] = None,
+        before_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get announces with optional filters
         
-        with self.get_connection() as conn:
+        Args:
+            event_type: Filter by event type (started, completed, stopped, or empty for updates)
+            info_hash: Filter by info hash (hex)
+            start_time: Filter events after this time
+            end_time: Filter events before this time
+            search: Search in info_hash_hex, client_ip, or user_agent
+            limit: Maximum results
+            before_timestamp: Only return events older than this timestamp
+                (the last timestamp of the previous page)
+            before_id: Id of the last event of the previous page (see
+                get_recent_announces)
+            
+        Returns:
+            List of announce event dictionaries
+        """
+        query, params = self._filter_query(
+            "*", event_type, info_hash, start_time, end_time, search, limit,
+            before_timestamp, before_id
+        )
+        with self.get_read_connection() as conn:
             cursor = conn.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
+            return [_row_to_dict(row) for row in cursor.fetchall()]
+    
+    def get_event_list_json(
+        self,
+        event_type: Optional[str] = None,
+        info_hash: Optional[str] = None,
+        search: Optional[str] = None,
+        limit: int = 100,
+        before_timestamp: Optional[str] = None,
+        before_id: Optional[int] = None
+    ) -> List[bytes]:
+        """
+        Get the dashboard event list as JSON objects serialized by SQLite
+        
+        Only the list columns are included; the raw_* text stays on disk
+        until a single event is opened (see get_announce_detail).
+        
+        Args:
+            event_type: Filter by event type
+            info_hash: Filter by info hash (hex)
+            search: Search in info_hash_hex, client_ip, or user_agent
+            limit: Maximum results
+            before_timestamp: Only return events older than this timestamp
+            before_id: Id of the last event of the previous page (see
+                get_recent_announces)
+            
+        Returns:
+            List of UTF-8 encoded JSON objects, newest first
+        """
+        query, params = self._filter_query(
+            EVENT_LIST_JSON, event_type, info_hash, None, None, search, limit,
+            before_timestamp, before_id
+        )
+        with self.get_read_connection() as conn:
+            # The JSON goes straight into the HTTP response, so skip decoding
+            # it to str (the pooled connection is ours until the block exits)
+            conn.text_factory = bytes
+            try:
+                return [row[0] for row in conn.execute(query, params)]
+            finally:
+                conn.text_factory = str
+    
+    def get_announce_detail(self, announce_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get every column of a single announce event
+        
+        Args:
+            announce_id: Row ID
+            
+        Returns:
+            Announce event dictionary, or None if it does not exist
+        """
+        with self.get_read_connection() as conn:
+            row = conn.execute(
+                "SELECT * FROM announces WHERE id = ?", (announce_id,)
+            ).fetchone()
+        
+        # Broadcast events can be opened before the writer commits them
+        if row is None and announce_id < self._next_id and self.flush_writes():
+            with self.get_read_connection() as conn:
+                row = conn.execute(
+                    "SELECT * FROM announces WHERE id = ?", (announce_id,)
+                ).fetchone()
+        return _row_to_dict(row) if row else None
     
+    @cached_read
     def get_unique_torrents(self) -> List[Dict[str, str]]:
         """
         Get list of unique torrents (info hashes) that have been announced
@@ -233,15 +885,15 @@ class Database:
         Returns:
             List of dictionaries with info_hash_hex and count
         """
-        with self.get_connection() as conn:
+        with self.get_read_connection() as conn:
             cursor = conn.execute("""
-                SELECT info_hash_hex, COUNT(*) as count
-                FROM announces
-                GROUP BY info_hash_hex
-                ORDER BY MAX(timestamp) DESC
+                SELECT info_hash_hex, count
+                FROM torrents_summary
+                ORDER BY last_seen DESC
             """)
             return [dict(row) for row in cursor.fetchall()]
     
+    @cached_read
     def get_event_counts(self) -> Dict[str, int]:
         """
         Get count of events by type
@@ -249,12 +901,8 @@ class Database:
         Returns:
             Dictionary mapping event type to count
         """
-        with self.get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT event, COUNT(*) as count
-                FROM announces
-                GROUP BY event
-            """)
+        with self.get_read_connection() as conn:
+            cursor = conn.execute("SELECT event, count FROM event_counts")
             
             result = {row['event'] if row['event'] else 'update': row['count'] 
                      for row in cursor.fetchall()}
@@ -270,14 +918,33 @@ class Database:
         Returns:
             Number of deleted rows
         """
-        cutoff = datetime.now() - timedelta(days=days)
+        cutoff = to_timestamp_us(datetime.now() - timedelta(days=days))
+        total_deleted = 0
+        
+        # Queued rows must not be written after their cleanup has run
+        self.flush_writes()
         
+        # Delete in chunks, committing after each one, so the write lock is
+        # released and tracker inserts are not blocked by a large cleanup
         with self.get_connection() as conn:
-            cursor = conn.execute("""
-                DELETE FROM announces
-                WHERE timestamp < ?
-            """, (cutoff.isoformat(),))
-            return cursor.rowcount
+            while True:
+                cursor = conn.execute("""
+                    DELETE FROM announces
+                    WHERE id IN (
+                        SELECT id FROM announces
+                        WHERE timestamp < ?
+                        ORDER BY timestamp, id
+                        LIMIT ?
+                    )
+                """, (cutoff, DELETE_CHUNK_SIZE))
+                conn.commit()
+                self._invalidate_cache()
+                
+                total_deleted += cursor.rowcount
+                if cursor.rowcount < DELETE_CHUNK_SIZE:
+                    break
+        
+        return total_deleted
     
     def clear_all_announces(self) -> int:
         """
@@ -286,10 +953,28 @@ class Database:
         Returns:
             Number of deleted rows
         """
+        # Write pending events first so they are cleared too, instead of
+        # reappearing once the writer catches up
+        self.flush_writes()
         with self.get_connection() as conn:
+            # Empty the derived tables directly and drop the per-row DELETE
+            # triggers, so SQLite can truncate announces instead of firing
+            # them once per row; all of it commits as one transaction
+            conn.execute("DELETE FROM torrents_summary")
+            conn.execute("DELETE FROM event_counts")
+            if self._fts_enabled:
+                conn.execute("INSERT INTO announces_fts(announces_fts) VALUES ('delete-all')")
+            conn.execute("DROP TRIGGER IF EXISTS announces_summary_delete")
+            conn.execute("DROP TRIGGER IF EXISTS announces_fts_delete")
             cursor = conn.execute("DELETE FROM announces")
-            return cursor.rowcount
+            self._create_summary_tables(conn)
+            if self._fts_enabled:
+                self._create_search_index(conn)
+
+        self._invalidate_cache()
+        return cursor.rowcount
     
+    @cached_read
     def get_stats(self) -> Dict[str, Any]:
         """
         Get database statistics
@@ -297,13 +982,13 @@ class Database:
         Returns:
             Dictionary with total events, unique torrents, date range
         """
-        with self.get_connection() as conn:
+        with self.get_read_connection() as conn:
             # Total events
-            cursor = conn.execute("SELECT COUNT(*) as total FROM announces")
+            cursor = conn.execute("SELECT COALESCE(SUM(count), 0) as total FROM event_counts")
             total = cursor.fetchone()['total']
             
             # Unique torrents
-            cursor = conn.execute("SELECT COUNT(DISTINCT info_hash_hex) as unique_torrents FROM announces")
+            cursor = conn.execute("SELECT COUNT(*) as unique_torrents FROM torrents_summary")
             unique = cursor.fetchone()['unique_torrents']
             
             # Date range
@@ -316,7 +1001,7 @@ class Database:
             return {
                 'total_events': total,
                 'unique_torrents': unique,
-                'earliest_event': dates['earliest'],
-                'latest_event': dates['latest']
+                'earliest_event': from_timestamp_us(dates['earliest']),
+                'latest_event': from_timestamp_us(dates['latest'])
             }
 
@@ -3,7 +3,6 @@ TrackerSpotter - Main entry point
 """
 
 import sys
-import webbrowser
 import threading
 import time
 import socket
@@ -11,52 +10,87 @@ import argparse
 from pathlib import Path
 
 from . import __version__
-from .tracker_server import TrackerServer
-from .tray import TrayIcon, is_tray_available
+from .utils import ADDRESS_IN_USE_ERRNOS, PERMISSION_DENIED_ERRNOS
 
+# Try to set UTF-8 encoding for better character support (once, at startup).
+# Anything still unencodable is replaced rather than raising, so the status
+# messages below can print emoji directly. stdout is None in windowed builds,
+# which hasattr also covers.
+if hasattr(sys.stdout, 'reconfigure'):
+    try:
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    except Exception:
+        pass
+
+BANNER = """
+================================================================
+                  TrackerSpotter v{version}
+           Local BitTorrent Tracker Monitor
+================================================================
 
-def open_browser(url: str, delay: float = 1.5):
+  Status: Running
+  
+  HTTP Tracker: http://{url_host}:{port}/announce
+  UDP Tracker:  udp://{url_host}:{port}/announce{ipv6_section}
+  Dashboard:    http://{url_host}:{port}
+
+  Copy a tracker URL above and add it to your torrent
+  client to start monitoring announces!
+  
+  Tip: UDP is faster and preferred by most clients
+
+  Press Ctrl+C to stop
+================================================================
+"""
+
+
+def open_browser(url: str, host: str, port: int, timeout: float = 5.0):
     """
-    Open browser after a delay
+    Open browser as soon as the server accepts connections
     
     Args:
         url: URL to open
-        delay: Seconds to wait before opening
+        host: Host to probe
+        port: Port to probe
+        timeout: Seconds to wait for the server before opening anyway
     """
-    time.sleep(delay)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection((host, port), timeout=0.1).close()
+            break
+        except OSError:
+            time.sleep(0.02)
+    
     try:
+        import webbrowser  # Only needed here; slow to import at startup
         webbrowser.open(url)
     except Exception:
         pass  # Silently fail if browser can't be opened
 
 
-def find_available_port(start_port: int = 6969, max_attempts: int = 10) -> int:
+def find_available_port(start_port: int = 6969) -> int:
     """
-    Find an available port starting from start_port
+    Find an available port, preferring start_port
     
     Args:
-        start_port: Preferred port to start searching from
-        max_attempts: Maximum number of ports to try
+        start_port: Preferred port
         
     Returns:
-        Available port number
+        start_port if it is free, otherwise a port chosen by the OS
         
     Raises:
-        OSError: If no available port found in range
+        OSError: If no port could be bound
     """
-    for offset in range(max_attempts):
-        port = start_port + offset
+    # Test if the port is available by attempting to bind; a failed bind
+    # leaves the socket unbound, so the same socket asks for port 0 next
+    # Don't use SO_REUSEADDR here - we want strict checking
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as test_socket:
         try:
-            # Test if port is available by attempting to bind
-            # Don't use SO_REUSEADDR here - we want strict checking
-            test_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            test_socket.bind(('127.0.0.1', port))
-            test_socket.close()
-            return port
+            test_socket.bind(('127.0.0.1', start_port))
         except OSError:
-            continue
-    
-    raise OSError(f"No available ports found in range {start_port}-{start_port + max_attempts - 1}")
+            test_socket.bind(('127.0.0.1', 0))
+        return test_socket.getsockname()[1]
 
 
 def format_url_host(host: str, is_ipv6: bool = False) -> str:
@@ -75,15 +109,6 @@ def print_banner(host: str, port: int, enable_ipv6: bool = False):
         port: Server port
         enable_ipv6: Whether IPv6 is enabled
     """
-    # Try to set UTF-8 encoding for better character support
-    import sys
-    import io
-    
-    try:
-        sys.stdout.reconfigure(encoding='utf-8')
-    except Exception:
-        pass
-    
     url_host = format_url_host(host)
     
     ipv6_section = ""
@@ -94,27 +119,12 @@ def print_banner(host: str, port: int, enable_ipv6: bool = False):
   IPv6 HTTP:    http://[{ipv6_host}]:{port}/announce
   IPv6 UDP:     udp://[{ipv6_host}]:{port}/announce"""
     
-    banner = f"""
-================================================================
-                  TrackerSpotter v{__version__}
-           Local BitTorrent Tracker Monitor
-================================================================
-
-  Status: Running
-  
-  HTTP Tracker: http://{url_host}:{port}/announce
-  UDP Tracker:  udp://{url_host}:{port}/announce{ipv6_section}
-  Dashboard:    http://{url_host}:{port}
-
-  Copy a tracker URL above and add it to your torrent
-  client to start monitoring announces!
-  
-  Tip: UDP is faster and preferred by most clients
-
-  Press Ctrl+C to stop
-================================================================
-"""
-    print(banner)
+    print(BANNER.format(
+        version=__version__,
+        url_host=url_host,
+        port=port,
+        ipv6_section=ipv6_section
+    ))
 
 
 def parse_args():
@@ -176,6 +186,11 @@ def main():
     # Parse command line arguments
     args = parse_args()
     
+    # Flask/Socket.IO and the tray backend are imported only now, so --help
+    # and --version exit before paying for them
+    from .tracker_server import TrackerServer
+    from .tray import TrayIcon, is_tray_available
+    
     HOST = args.host
     DEBUG = args.debug
     PREFERRED_PORT = args.port
@@ -189,7 +204,7 @@ def main():
             kernel32 = ctypes.windll.kernel32
             kernel32.SetConsoleOutputCP(65001)  # UTF-8
     except Exception:
-        pass  # If it fails, we'll use ASCII symbols
+        pass  # stdout already replaces characters the console cannot encode
     
     # Security warning for non-localhost binding
     if HOST != '127.0.0.1':
@@ -204,20 +219,14 @@ def main():
         print("\nMake sure your firewall is configured appropriately!")
         print("="*60 + "\n")
     
-    # Find available port (tries preferred port first, then increments)
+    # Find available port (preferred port first, else one picked by the OS)
     try:
         PORT = find_available_port(PREFERRED_PORT)
         if PORT != PREFERRED_PORT:
-            try:
-                print(f"\n⚠️  Port {PREFERRED_PORT} is busy, using port {PORT} instead")
-            except UnicodeEncodeError:
-                print(f"\n[!] Port {PREFERRED_PORT} is busy, using port {PORT} instead")
+            print(f"\n⚠️  Port {PREFERRED_PORT} is busy, using port {PORT} instead")
             print(f"   Check the dashboard for the correct tracker URL!\n")
     except OSError as e:
-        try:
-            print(f"\n❌ ERROR: Could not find an available port")
-        except UnicodeEncodeError:
-            print(f"\n[X] ERROR: Could not find an available port")
+        print(f"\n❌ ERROR: Could not find an available port")
         print(f"   {e}")
         print(f"\n   Try closing other applications and restart TrackerSpotter.\n")
         sys.exit(1)
@@ -238,12 +247,14 @@ def main():
         tray_icon = TrayIcon(host=HOST, port=PORT, on_exit=on_exit)
         tray_icon.start()
     
-    # Open browser in background thread (if enabled)
+    # Open browser in background thread once the server is up (if enabled)
     if AUTO_BROWSER:
         # Use localhost for browser URL even if bound to 0.0.0.0
         browser_host = '127.0.0.1' if HOST == '0.0.0.0' else HOST
         url = f"http://{browser_host}:{PORT}"
-        browser_thread = threading.Thread(target=open_browser, args=(url,), daemon=True)
+        browser_thread = threading.Thread(
+            target=open_browser, args=(url, browser_host, PORT), daemon=True
+        )
         browser_thread.start()
     
     try:
@@ -255,12 +266,17 @@ def main():
         print("\n\nShutting down TrackerSpotter... Goodbye!")
         sys.exit(0)
     except OSError as e:
-        if "Address already in use" in str(e):
+        if e.errno in ADDRESS_IN_USE_ERRNOS:
             # This should rarely happen now due to auto port detection
             print(f"\n❌ ERROR: Port {PORT} is already in use!")
             print(f"\n   This is unexpected - the port was available moments ago.")
             print(f"   Another application may have grabbed it. Please restart TrackerSpotter.\n")
             sys.exit(1)
+        elif e.errno in PERMISSION_DENIED_ERRNOS:
+            print(f"\n❌ ERROR: Permission denied binding to port {PORT}")
+            print(f"\n   Ports below 1024 need administrator rights, or the port is reserved.")
+            print(f"   Use --port to pick another port.\n")
+            sys.exit(1)
         else:
             print(f"\n❌ ERROR: Failed to start server: {e}\n")
             sys.exit(1)
@@ -2,7 +2,7 @@
 Data models for TrackerSpotter announce events
 """
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
@@ -12,7 +12,7 @@ class AnnounceEvent:
     """Represents a single announce event from a torrent client"""
     
     id: Optional[int] = None
-    timestamp: datetime = None
+    timestamp: datetime = field(default_factory=datetime.now)
     info_hash: str = ""
     info_hash_hex: str = ""
     peer_id: str = ""
@@ -29,17 +29,17 @@ class AnnounceEvent:
     raw_query: str = ""
     raw_headers: str = ""  # Raw HTTP headers as-is for client file making
     
-    def __post_init__(self):
-        """Set timestamp if not provided"""
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
-    
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization"""
-        data = asdict(self)
+        """
+        Convert to dictionary for JSON serialization
+        
+        Returns a shallow copy of the fields: all of them are flat values, so
+        the deep copy done by dataclasses.asdict() is not needed.
+        """
+        data = self.__dict__.copy()
         # Convert datetime to ISO format string
         if isinstance(data['timestamp'], datetime):
-            data['timestamp'] = data['timestamp'].isoformat()
+            data['timestamp'] = data['timestamp'].isoformat(timespec='microseconds')
         return data
     
     @property
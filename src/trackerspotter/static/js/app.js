@@ -127,7 +127,13 @@ function initializeWebSocket() {
     
     socket.on('new_announce', (event) => {
         console.log('New announce received:', event);
-        handleNewAnnounce(event);
+        handleNewAnnounces([event]);
+    });
+    
+    // The server coalesces bursts of announces into one message
+    socket.on('new_announces_batch', (events) => {
+        console.log(`${events.length} new announce(s) received`);
+        handleNewAnnounces(events);
     });
     
     socket.on('logs_cleared', (data) => {
@@ -209,27 +215,37 @@ async function loadStats() {
 }
 
 // Handle new announce from WebSocket
-function handleNewAnnounce(event) {
-    // Ensure event has required fields
-    if (!event.info_hash_hex || !event.timestamp) {
-        console.error('Invalid event received:', event);
-        return;
-    }
+function handleNewAnnounces(events) {
+    let added = 0;
     
-    // Generate a temporary ID if not present
-    if (!event.id) {
-        event.id = Date.now() + Math.random();
+    // Events arrive oldest first, so each one goes in front of the previous
+    for (const event of events) {
+        // Ensure event has required fields
+        if (!event.info_hash_hex || !event.timestamp) {
+            console.error('Invalid event received:', event);
+            continue;
+        }
+        
+        // Generate a temporary ID if not present
+        if (!event.id) {
+            event.id = Date.now() + Math.random();
+        }
+        
+        // Add to beginning of array
+        allEvents.unshift(event);
+        added++;
     }
     
-    // Add to beginning of array
-    allEvents.unshift(event);
+    if (added === 0) {
+        return;
+    }
     
     // Cap events in memory to prevent memory issues
     if (allEvents.length > MAX_EVENTS_IN_MEMORY) {
         allEvents = allEvents.slice(0, MAX_EVENTS_IN_MEMORY);
     }
     
-    // Apply filters to update the display
+    // Apply filters to update the display (once per batch)
     applyFilters();
     
     // Update stats and torrent filter
@@ -314,7 +330,10 @@ function renderEvents() {
         
         // Determine protocol (HTTP if raw_headers exists, otherwise UDP)
         // UDP requests don't have HTTP headers, so raw_headers will be empty
-        const isUDP = !event.raw_headers || event.raw_headers === '';
+        // Events loaded from /api/events carry is_http instead of raw_headers
+        const isUDP = 'is_http' in event
+            ? !event.is_http
+            : (!event.raw_headers || event.raw_headers === '');
         const protocolBadge = isUDP 
             ? '<span class="protocol-badge udp" title="UDP Protocol">UDP</span>' 
             : '<span class="protocol-badge http" title="HTTP Protocol">HTTP</span>';
@@ -372,10 +391,24 @@ function updateTorrentFilter(torrents) {
 }
 
 // Detail Panel
-function showEventDetails(eventId) {
+async function showEventDetails(eventId) {
     const event = allEvents.find(e => e.id === eventId);
     if (!event) return;
     
+    // Events from /api/events only have the list columns; fetch the rest once
+    if (!('raw_query' in event)) {
+        try {
+            const response = await fetch(`/api/events/${eventId}`);
+            const data = await response.json();
+            
+            if (data.success) {
+                Object.assign(event, data.event);
+            }
+        } catch (error) {
+            console.error('Error loading event details:', error);
+        }
+    }
+    
     const eventType = event.event || 'update';
     const clientInfo = extractClientInfo(event.user_agent, event.peer_id);
     
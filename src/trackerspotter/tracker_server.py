@@ -3,18 +3,35 @@ BitTorrent Tracker HTTP Server
 Implements BEP 3: The BitTorrent Protocol
 """
 
-from flask import Flask, request, Response, send_from_directory, jsonify
+from flask import Flask, request, Response, send_from_directory, jsonify, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_socketio import SocketIO, emit
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from typing import Optional
+import csv
+import io
+import json
 import logging
 import sys
 import secrets
+import threading
+import time
+import zlib
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .models import AnnounceEvent
 from .database import Database
 from .utils import (
+    ADDRESS_IN_USE_ERRNOS,
+    bencode,
     parse_info_hash,
     parse_peer_id,
     create_tracker_response,
@@ -30,9 +47,65 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Announces arriving within this window are sent as one WebSocket message
+BROADCAST_INTERVAL = 0.05
+
+# Seconds that /api/stats and /api/torrents responses are shared between tabs
+RESPONSE_CACHE_TTL = 1.0
+
+# Rows written per chunk when streaming an export
+EXPORT_CHUNK_ROWS = 500
+
+# Announce responses never list peers, so there is one body per peer format
+ANNOUNCE_RESPONSES = {
+    compact: create_tracker_response(interval=1800, compact=compact)  # 30 minutes
+    for compact in (True, False)
+}
+
 # UDP event broadcasting is handled via callback in TrackerServer instance
 
 
+def json_bytes(obj) -> bytes:
+    """Serialize obj to UTF-8 JSON, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def format_raw_headers(headers) -> str:
+    """
+    Format request headers as raw "Header-Name: value" lines joined by CRLF
+    
+    Args:
+        headers: Werkzeug headers (iterates as (name, value) tuples)
+        
+    Returns:
+        Header block as text
+    """
+    return "\r\n".join(map(": ".join, headers))
+
+
+@lru_cache(maxsize=64)
+def _failure_body(error_message: str) -> bytes:
+    """Bencoded tracker failure response (the same few messages repeat)"""
+    return bencode({b'failure reason': error_message.encode('utf-8')})
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes with orjson (used by jsonify)"""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, default=self.default),
+                                        mimetype=self.mimetype)
+
+
 class TrackerServer:
     """BitTorrent tracker server with web UI"""
     
@@ -52,6 +125,11 @@ class TrackerServer:
         self.debug = debug
         self.enable_ipv6 = enable_ipv6
         
+        # Werkzeug logs a request line for every announce; the handlers already
+        # log what matters, so keep only its errors outside debug mode
+        if not debug:
+            logging.getLogger('werkzeug').setLevel(logging.ERROR)
+        
         # Determine static folder path based on execution mode
         if getattr(sys, 'frozen', False):
             # Running as PyInstaller executable
@@ -65,18 +143,33 @@ class TrackerServer:
         self.app = Flask(__name__, 
                         static_folder=str(base_path),
                         static_url_path='/static')
+        if ORJSON_AVAILABLE:
+            self.app.json = OrjsonProvider(self.app)
         # Generate random secret key at runtime for session security
         self.app.config['SECRET_KEY'] = secrets.token_hex(32)
         
         # Initialize SocketIO for real-time updates
-        # Simple configuration for maximum compatibility
+        # Simple configuration for maximum compatibility. The mode is pinned:
+        # Flask-SocketIO would otherwise pick eventlet/gevent if installed, and
+        # the UDP trackers, database writer and tray all rely on real threads.
         self.socketio = SocketIO(
             self.app, 
+            async_mode='threading',
             cors_allowed_origins="*",
             logger=False,
             engineio_logger=False
         )
         
+        # /api/config only depends on the arguments above
+        self._config_body = json_bytes(self._build_config())
+        
+        # Serialized dashboard responses: key -> (monotonic time, JSON bytes, ETag)
+        self._response_cache = {}
+        
+        # Announces waiting for the next batched broadcast
+        self._pending_broadcasts = []
+        self._broadcast_lock = threading.Lock()
+        
         # Initialize database
         self.db = Database()
         
@@ -128,10 +221,7 @@ class TrackerServer:
                 info_hashes = request.args.getlist('info_hash')
                 
                 # Capture raw HTTP headers
-                raw_headers_lines = []
-                for header_name, header_value in request.headers:
-                    raw_headers_lines.append(f"{header_name}: {header_value}")
-                raw_headers = "\r\n".join(raw_headers_lines)
+                raw_headers = format_raw_headers(request.headers)
                 
                 # Get client info
                 client_ip = request.remote_addr
@@ -147,8 +237,7 @@ class TrackerServer:
                             
                             # Create scrape event
                             scrape_event = AnnounceEvent(
-                                timestamp=datetime.now(),
-                                info_hash=info_hash_raw_bytes.hex() if info_hash_raw_bytes else info_hash_hex,
+                                info_hash=info_hash_hex,
                                 info_hash_hex=info_hash_hex,
                                 peer_id="",  # Scrape doesn't have peer_id
                                 client_ip=client_ip,
@@ -165,9 +254,8 @@ class TrackerServer:
                                 raw_headers=raw_headers
                             )
                             
-                            # Store in database
-                            event_id = self.db.insert_announce(scrape_event)
-                            scrape_event.id = event_id
+                            # Queue for the background database writer
+                            scrape_event.id = self.db.queue_announce(scrape_event)
                             
                             # Broadcast to connected web clients
                             self._broadcast_event(scrape_event)
@@ -175,17 +263,16 @@ class TrackerServer:
                         continue
                 
                 # Log the scrape
-                hash_count = len(scraped_hashes)
-                logger.info(
-                    f"Scrape received: {hash_count} hash(es) | "
-                    f"Client: {client_ip} | "
-                    f"Hashes: {', '.join(h[:8] + '...' for h in scraped_hashes[:3])}"
-                    f"{'...' if hash_count > 3 else ''}"
-                )
+                if logger.isEnabledFor(logging.INFO):
+                    hash_count = len(scraped_hashes)
+                    logger.info(
+                        "Scrape received: %d hash(es) | Client: %s | Hashes: %s%s",
+                        hash_count, client_ip,
+                        ', '.join(h[:8] + '...' for h in scraped_hashes[:3]),
+                        '...' if hash_count > 3 else ''
+                    )
                 
                 # Return minimal valid scrape response (we're just monitoring)
-                from .utils import bencode
-                
                 files = {}
                 for info_hash_hex in scraped_hashes:
                     # Convert hex back to bytes for the response key
@@ -200,9 +287,7 @@ class TrackerServer:
                 
             except Exception as e:
                 logger.error(f"Error processing scrape: {e}", exc_info=True)
-                from .utils import bencode
-                error_dict = {b'failure reason': b'Internal server error'}
-                return Response(bencode(error_dict), mimetype='text/plain')
+                return self._create_error_response("Internal server error")
         
         @self.app.route('/announce')
         def announce():
@@ -211,50 +296,49 @@ class TrackerServer:
             BEP 3: The BitTorrent Protocol
             """
             try:
-                # Parse required parameters
-                info_hash_raw, info_hash_hex = parse_info_hash(request.args.get('info_hash', ''))
-                peer_id = parse_peer_id(request.args.get('peer_id', ''))
+                args = request.args
                 
-                if not info_hash_hex or not peer_id:
+                # Check the required parameters before decoding anything, so
+                # malformed requests (scanners) are rejected cheaply
+                info_hash_param = args.get('info_hash')
+                peer_id_param = args.get('peer_id')
+                if not info_hash_param or not peer_id_param:
                     return self._create_error_response("Missing required parameters")
                 
-                # Parse optional parameters with safe integer conversion
-                def safe_int(value, default=0, min_val=0, max_val=None):
-                    """Safely convert to int with bounds checking"""
-                    try:
-                        result = int(value) if value else default
-                        if result < min_val:
-                            result = min_val
-                        if max_val is not None and result > max_val:
-                            result = max_val
-                        return result
-                    except (ValueError, TypeError):
-                        return default
+                _, info_hash_hex = parse_info_hash(info_hash_param)
+                peer_id = parse_peer_id(peer_id_param) if info_hash_hex else ''
+                if not peer_id:
+                    return self._create_error_response("Missing required parameters")
+                
+                # Parse optional parameters; type=int falls back to the default
+                # on malformed values, so only the bounds need checking here
+                def clamp(value, min_val=0, max_val=None):
+                    """Clamp an integer into [min_val, max_val]"""
+                    if value < min_val:
+                        return min_val
+                    if max_val is not None and value > max_val:
+                        return max_val
+                    return value
                 
-                port = safe_int(request.args.get('port'), 0, 0, 65535)
-                uploaded = safe_int(request.args.get('uploaded'), 0, 0)
-                downloaded = safe_int(request.args.get('downloaded'), 0, 0)
-                left = safe_int(request.args.get('left'), 0, 0)
-                event = request.args.get('event', '') or ''
-                compact = safe_int(request.args.get('compact'), 1, 0, 1)
-                numwant = safe_int(request.args.get('numwant'), 50, 0, 200)
-                key = request.args.get('key', '') or ''
+                port = clamp(args.get('port', 0, type=int), 0, 65535)
+                uploaded = clamp(args.get('uploaded', 0, type=int))
+                downloaded = clamp(args.get('downloaded', 0, type=int))
+                left = clamp(args.get('left', 0, type=int))
+                event = args.get('event', '')
+                compact = clamp(args.get('compact', 1, type=int), 0, 1)
+                numwant = clamp(args.get('numwant', 50, type=int), 0, 200)
+                key = args.get('key', '')
                 
                 # Get client info
                 client_ip = request.remote_addr
                 user_agent = request.headers.get('User-Agent', '')
                 
                 # Capture raw HTTP headers as-is (important for client file making)
-                # Format: "Header-Name: value\r\n" for each header
-                raw_headers_lines = []
-                for header_name, header_value in request.headers:
-                    raw_headers_lines.append(f"{header_name}: {header_value}")
-                raw_headers = "\r\n".join(raw_headers_lines)
+                raw_headers = format_raw_headers(request.headers)
                 
                 # Create announce event
                 announce_event = AnnounceEvent(
-                    timestamp=datetime.now(),
-                    info_hash=info_hash_raw.hex(),
+                    info_hash=info_hash_hex,
                     info_hash_hex=info_hash_hex,
                     peer_id=peer_id,
                     client_ip=client_ip,
@@ -271,29 +355,21 @@ class TrackerServer:
                     raw_headers=raw_headers
                 )
                 
-                # Store in database
-                event_id = self.db.insert_announce(announce_event)
-                announce_event.id = event_id
+                # Queue for the background database writer
+                announce_event.id = self.db.queue_announce(announce_event)
                 
                 # Log the event
                 event_type = event if event else "update"
                 logger.info(
-                    f"Announce received: {event_type} | "
-                    f"Torrent: {info_hash_hex[:8]}... | "
-                    f"Client: {client_ip}:{port} | "
-                    f"↓{downloaded} ↑{uploaded} ⏳{left}"
+                    "Announce received: %s | Torrent: %s... | Client: %s:%d | ↓%d ↑%d ⏳%d",
+                    event_type, info_hash_hex[:8], client_ip, port, downloaded, uploaded, left
                 )
                 
                 # Broadcast to connected web clients via WebSocket
                 self._broadcast_event(announce_event)
                 
                 # Return minimal valid tracker response
-                response_data = create_tracker_response(
-                    interval=1800,  # 30 minutes
-                    compact=(compact == 1)
-                )
-                
-                return Response(response_data, mimetype='text/plain')
+                return Response(ANNOUNCE_RESPONSES[compact == 1], mimetype='text/plain')
                 
             except ValueError as e:
                 logger.error(f"Invalid announce parameters: {e}")
@@ -310,45 +386,72 @@ class TrackerServer:
                 event_type = request.args.get('event_type')
                 info_hash = request.args.get('info_hash')
                 search = request.args.get('search')
-                limit = int(request.args.get('limit', 100))
+                limit = max(request.args.get('limit', 100, type=int), 1)
+                # Keyset pagination: pass the previous page's next_before as
+                # before=<timestamp>&before_id=<id>
+                before = request.args.get('before')
+                before_id = request.args.get('before_id')
+                if before:
+                    try:
+                        valid = datetime.fromisoformat(before).tzinfo is None
+                    except ValueError:
+                        valid = False
+                    if not valid:
+                        return jsonify({'success': False, 'error': 'Invalid before timestamp'}), 400
+                if before_id is not None:
+                    try:
+                        before_id = int(before_id)
+                    except ValueError:
+                        return jsonify({'success': False, 'error': 'Invalid before_id'}), 400
+
+                # Query database; rows come back already serialized by SQLite
+                events = self.db.get_event_list_json(
+                    event_type=event_type if event_type != 'all' else None,
+                    info_hash=info_hash if info_hash != 'all' else None,
+                    search=search,
+                    limit=limit,
+                    before_timestamp=before,
+                    before_id=before_id
+                )
                 
-                # Query database
-                if any([event_type, info_hash, search]):
-                    events = self.db.get_announces_by_filter(
-                        event_type=event_type if event_type != 'all' else None,
-                        info_hash=info_hash if info_hash != 'all' else None,
-                        search=search,
-                        limit=limit
-                    )
-                else:
-                    events = self.db.get_recent_announces(limit=limit)
+                # Cursor of the oldest event on this page, or None when there are no more
+                next_before = None
+                if len(events) == limit:
+                    last = json.loads(events[-1])
+                    next_before = {'timestamp': last['timestamp'], 'id': last['id']}
                 
-                # Clean up events for JSON serialization
-                clean_events = []
-                for event in events:
-                    clean_event = dict(event)
-                    # Ensure info_hash is a string, not bytes
-                    if isinstance(clean_event.get('info_hash'), bytes):
-                        clean_event['info_hash'] = clean_event['info_hash'].decode('utf-8', errors='ignore')
-                    clean_events.append(clean_event)
+                body = (
+                    b'{"success": true, "events": [' + b','.join(events) + b'], '
+                    + f'"count": {len(events)}, "next_before": {json.dumps(next_before)}}}'.encode()
+                )
+                return Response(body, mimetype='application/json')
+            except Exception as e:
+                logger.error(f"Error fetching events: {e}", exc_info=True)
+                return jsonify({'success': False, 'error': str(e)}), 500
+        
+        @self.app.route('/api/events/<int:event_id>')
+        def get_event(event_id):
+            """Get every field of a single event (the list omits raw data)"""
+            try:
+                event = self.db.get_announce_detail(event_id)
+                if event is None:
+                    return jsonify({'success': False, 'error': 'Event not found'}), 404
                 
                 return jsonify({
                     'success': True,
-                    'events': clean_events,
-                    'count': len(clean_events)
+                    'event': event
                 })
             except Exception as e:
-                logger.error(f"Error fetching events: {e}", exc_info=True)
+                logger.error(f"Error fetching event {event_id}: {e}")
                 return jsonify({'success': False, 'error': str(e)}), 500
         
         @self.app.route('/api/torrents')
         def get_torrents():
             """Get list of unique torrents"""
             try:
-                torrents = self.db.get_unique_torrents()
-                return jsonify({
+                return self._cached_json('torrents', lambda: {
                     'success': True,
-                    'torrents': torrents
+                    'torrents': self.db.get_unique_torrents()
                 })
             except Exception as e:
                 logger.error(f"Error fetching torrents: {e}")
@@ -358,13 +461,10 @@ class TrackerServer:
         def get_stats():
             """Get database statistics"""
             try:
-                stats = self.db.get_stats()
-                event_counts = self.db.get_event_counts()
-                
-                return jsonify({
+                return self._cached_json('stats', lambda: {
                     'success': True,
-                    'stats': stats,
-                    'event_counts': event_counts
+                    'stats': self.db.get_stats(),
+                    'event_counts': self.db.get_event_counts()
                 })
             except Exception as e:
                 logger.error(f"Error fetching stats: {e}")
@@ -372,39 +472,15 @@ class TrackerServer:
         
         @self.app.route('/api/config')
         def get_config():
-            """Get server configuration for UI"""
-            # Determine display host (use 127.0.0.1 if bound to all interfaces)
-            display_host = '127.0.0.1' if self.host == '0.0.0.0' else self.host
-            
-            config = {
-                'success': True,
-                'host': self.host,
-                'display_host': display_host,
-                'port': self.port,
-                'http_url': f"http://{display_host}:{self.port}/announce",
-                'udp_url': f"udp://{display_host}:{self.port}/announce",
-                'is_localhost': self.host in ('127.0.0.1', 'localhost', '::1'),
-                'ipv6_enabled': self.enable_ipv6
-            }
-            
-            # Add IPv6 URLs if enabled
-            if self.enable_ipv6:
-                ipv6_host = '::1' if self.host in ('127.0.0.1', 'localhost') else '::' if self.host == '0.0.0.0' else None
-                if ipv6_host:
-                    config['ipv6_host'] = ipv6_host
-                    config['http_url_ipv6'] = f"http://[{ipv6_host}]:{self.port}/announce"
-                    config['udp_url_ipv6'] = f"udp://[{ipv6_host}]:{self.port}/announce"
-            
-            # Add version info
-            config['version'] = __version__
-            
-            return jsonify(config)
+            """Get server configuration for UI (fixed for the process lifetime)"""
+            return Response(self._config_body, mimetype='application/json')
         
         @self.app.route('/api/clear', methods=['POST'])
         def clear_logs():
             """Clear all announce logs"""
             try:
                 count = self.db.clear_all_announces()
+                self._response_cache.clear()
                 logger.info(f"Cleared {count} announce events")
                 
                 # Notify all clients
@@ -420,65 +496,85 @@ class TrackerServer:
         
         @self.app.route('/api/export/csv')
         def export_csv():
-            """Export events to CSV"""
-            try:
-                events = self.db.get_recent_announces(limit=10000)
+            """Export events to CSV, streamed in chunks of rows"""
+            def generate():
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
                 
-                # Generate CSV
-                csv_lines = [
-                    'timestamp,event,info_hash,client_ip,client_port,downloaded,uploaded,left,user_agent,raw_query'
-                ]
+                def flush():
+                    data = buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+                    return data
                 
-                for event in events:
-                    # Escape quotes in raw_query for CSV
-                    raw_query = event.get('raw_query', '') or ''
-                    raw_query_escaped = raw_query.replace('"', '""')
-                    csv_lines.append(
-                        f"{event['timestamp']},"
-                        f"{event['event'] if event['event'] else 'update'},"
-                        f"{event['info_hash_hex']},"
-                        f"{event['client_ip']},"
-                        f"{event['client_port']},"
-                        f"{event['downloaded']},"
-                        f"{event['uploaded']},"
-                        f"{event['left']},"
-                        f"\"{event['user_agent']}\","
-                        f"\"{raw_query_escaped}\""
-                    )
-                
-                csv_data = '\n'.join(csv_lines)
+                writer.writerow([
+                    'timestamp', 'event', 'info_hash', 'client_ip', 'client_port',
+                    'downloaded', 'uploaded', 'left', 'user_agent', 'raw_query'
+                ])
+                yield flush()
                 
-                return Response(
-                    csv_data,
-                    mimetype='text/csv',
-                    headers={
-                        'Content-Disposition': f'attachment; filename=trackerspotter_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
-                    }
+                rows = (
+                    (
+                        event['timestamp'],
+                        event['event'] or 'update',
+                        event['info_hash_hex'],
+                        event['client_ip'],
+                        event['client_port'],
+                        event['downloaded'],
+                        event['uploaded'],
+                        event['left'],
+                        event['user_agent'],
+                        event.get('raw_query') or ''
+                    )
+                    for event in self.db.iter_recent_announces(limit=10000)
                 )
-            except Exception as e:
-                logger.error(f"Error exporting CSV: {e}")
-                return jsonify({'success': False, 'error': str(e)}), 500
+                try:
+                    # writerows() escapes a whole chunk in C; one yield per chunk
+                    for chunk in iter(lambda: list(islice(rows, EXPORT_CHUNK_ROWS)), []):
+                        writer.writerows(chunk)
+                        yield flush()
+                except Exception as e:
+                    # Headers are already sent, so the export just ends early
+                    logger.error(f"Error exporting CSV: {e}")
+            
+            return Response(
+                stream_with_context(generate()),
+                mimetype='text/csv',
+                headers={
+                    'Content-Disposition': f'attachment; filename=trackerspotter_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
+                }
+            )
         
         @self.app.route('/api/export/json')
         def export_json():
-            """Export events to JSON"""
-            try:
-                events = self.db.get_recent_announces(limit=10000)
+            """Export events to JSON, streamed in chunks of rows"""
+            now = datetime.now()
+            
+            def generate():
+                yield b'{"export_date": ' + json_bytes(now.isoformat()) + b', "events": ['
                 
-                return Response(
-                    jsonify({
-                        'export_date': datetime.now().isoformat(),
-                        'total_events': len(events),
-                        'events': events
-                    }).get_data(as_text=True),
-                    mimetype='application/json',
-                    headers={
-                        'Content-Disposition': f'attachment; filename=trackerspotter_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
-                    }
-                )
-            except Exception as e:
-                logger.error(f"Error exporting JSON: {e}")
-                return jsonify({'success': False, 'error': str(e)}), 500
+                events = self.db.iter_recent_announces(limit=10000)
+                total = 0
+                try:
+                    # Encode a whole chunk per call and splice it into the
+                    # array by dropping the chunk's own brackets
+                    for chunk in iter(lambda: list(islice(events, EXPORT_CHUNK_ROWS)), []):
+                        yield (b',' if total else b'') + json_bytes(chunk)[1:-1]
+                        total += len(chunk)
+                except Exception as e:
+                    # Headers are already sent, so the export just ends early
+                    logger.error(f"Error exporting JSON: {e}")
+                
+                # The count is only known once every row has been written
+                yield b'], "total_events": %d}\n' % total
+            
+            return Response(
+                stream_with_context(generate()),
+                mimetype='application/json',
+                headers={
+                    'Content-Disposition': f'attachment; filename=trackerspotter_{now.strftime("%Y%m%d_%H%M%S")}.json'
+                }
+            )
         
         # WebSocket events
         @self.socketio.on('connect')
@@ -502,22 +598,99 @@ class TrackerServer:
         Returns:
             Flask Response with bencoded error
         """
-        from .utils import bencode
+        return Response(_failure_body(error_message), mimetype='text/plain')
+    
+    def _build_config(self) -> dict:
+        """Server configuration shown by the dashboard"""
+        # Determine display host (use 127.0.0.1 if bound to all interfaces)
+        display_host = '127.0.0.1' if self.host == '0.0.0.0' else self.host
+        
+        config = {
+            'success': True,
+            'host': self.host,
+            'display_host': display_host,
+            'port': self.port,
+            'http_url': f"http://{display_host}:{self.port}/announce",
+            'udp_url': f"udp://{display_host}:{self.port}/announce",
+            'is_localhost': self.host in ('127.0.0.1', 'localhost', '::1'),
+            'ipv6_enabled': self.enable_ipv6
+        }
+        
+        # Add IPv6 URLs if enabled
+        if self.enable_ipv6:
+            ipv6_host = '::1' if self.host in ('127.0.0.1', 'localhost') else '::' if self.host == '0.0.0.0' else None
+            if ipv6_host:
+                config['ipv6_host'] = ipv6_host
+                config['http_url_ipv6'] = f"http://[{ipv6_host}]:{self.port}/announce"
+                config['udp_url_ipv6'] = f"udp://[{ipv6_host}]:{self.port}/announce"
+        
+        # Add version info
+        config['version'] = __version__
         
-        error_dict = {b'failure reason': error_message.encode('utf-8')}
-        return Response(bencode(error_dict), mimetype='text/plain')
+        return config
+    
+    def _cached_json(self, key: str, build) -> Response:
+        """
+        Serve a JSON response, rebuilding it at most every RESPONSE_CACHE_TTL seconds
+        
+        Args:
+            key: Cache key (one per route)
+            build: Callable returning the payload to serialize
+            
+        Returns:
+            JSON Response (304 Not Modified if the client's ETag still matches)
+        """
+        now = time.monotonic()
+        cached = self._response_cache.get(key)
+        if cached is None or now - cached[0] >= RESPONSE_CACHE_TTL:
+            body = json_bytes(build())
+            cached = (now, body, format(zlib.crc32(body), '08x'))
+            self._response_cache[key] = cached
+        
+        response = Response(cached[1], mimetype='application/json')
+        response.set_etag(cached[2])
+        response.cache_control.max_age = int(RESPONSE_CACHE_TTL)
+        return response.make_conditional(request)
     
     def _broadcast_event(self, event: AnnounceEvent):
         """
-        Broadcast announce event to all connected WebSocket clients
+        Queue an announce event for the next batched WebSocket broadcast
         
         Args:
             event: AnnounceEvent to broadcast
         """
+        # Raw query/headers are the bulk of an event and are only shown in the
+        # details dialog, which fetches them from /api/events/<id> on demand
+        data = event.to_dict()
+        data.pop('raw_query')
+        data['is_http'] = bool(data.pop('raw_headers'))
+        
+        with self._broadcast_lock:
+            self._pending_broadcasts.append(data)
+            if len(self._pending_broadcasts) > 1:
+                # A flush is already scheduled
+                return
+        
         try:
-            self.socketio.emit('new_announce', event.to_dict())
+            self.socketio.start_background_task(self._flush_broadcasts)
         except Exception as e:
             logger.error(f"Error broadcasting event: {e}", exc_info=True)
+            # Drop the batch so the next event schedules a fresh flush
+            with self._broadcast_lock:
+                self._pending_broadcasts = []
+    
+    def _flush_broadcasts(self):
+        """Send the queued announce events to all clients in one message"""
+        self.socketio.sleep(BROADCAST_INTERVAL)
+        
+        with self._broadcast_lock:
+            events = self._pending_broadcasts
+            self._pending_broadcasts = []
+        
+        try:
+            self.socketio.emit('new_announces_batch', events)
+        except Exception as e:
+            logger.error(f"Error broadcasting events: {e}", exc_info=True)
     
     def run(self):
         """Start the tracker server (HTTP and UDP)"""
@@ -553,10 +726,12 @@ class TrackerServer:
                 host=self.host,
                 port=self.port,
                 debug=self.debug,
+                use_reloader=False,  # Would restart the process and its UDP/tray threads
+                log_output=self.debug,
                 allow_unsafe_werkzeug=True  # For PyInstaller packaging
             )
         except OSError as e:
-            if "Address already in use" in str(e):
+            if e.errno in ADDRESS_IN_USE_ERRNOS:
                 logger.error(f"Port {self.port} is already in use!")
                 logger.error("Try changing the port or stop the other application")
             else:
@@ -571,4 +746,5 @@ class TrackerServer:
                 self.udp_tracker.stop()
             if self.udp_tracker_ipv6:
                 self.udp_tracker_ipv6.stop()
+            self.db.close()
 
@@ -4,7 +4,6 @@ Provides visual indication that the server is running and quick access to contro
 """
 
 import threading
-import webbrowser
 import sys
 import subprocess
 from typing import Callable, Optional
@@ -189,6 +188,7 @@ class TrayIcon:
     def _open_dashboard(self, icon=None, item=None):
         """Open dashboard in browser"""
         try:
+            import webbrowser
             webbrowser.open(self.dashboard_url)
         except Exception:
             pass
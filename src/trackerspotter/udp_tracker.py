@@ -9,7 +9,6 @@ import time
 import logging
 import threading
 from typing import Optional, Tuple
-from datetime import datetime
 
 from .models import AnnounceEvent
 from .database import Database
@@ -241,7 +240,6 @@ class UDPTrackerServer:
             peer_id_str = peer_id.hex()
             
             announce_event = AnnounceEvent(
-                timestamp=datetime.now(),
                 info_hash=info_hash_str,  # Store as hex string, not bytes
                 info_hash_hex=info_hash_str,
                 peer_id=peer_id_str,
@@ -258,17 +256,14 @@ class UDPTrackerServer:
                 raw_query=f"UDP announce from {addr[0]}:{port}"
             )
             
-            # Store in database
-            event_id = self.db.insert_announce(announce_event)
-            announce_event.id = event_id
+            # Queue for the background database writer
+            announce_event.id = self.db.queue_announce(announce_event)
             
             # Log the event
             event_type = event if event else "update"
             logger.info(
-                f"UDP Announce: {event_type} | "
-                f"Torrent: {info_hash.hex()[:8]}... | "
-                f"Client: {addr[0]}:{port} | "
-                f"↓{downloaded} ↑{uploaded} ⏳{left}"
+                "UDP Announce: %s | Torrent: %s... | Client: %s:%d | ↓%d ↑%d ⏳%d",
+                event_type, info_hash_str[:8], addr[0], port, downloaded, uploaded, left
             )
             
             # Send announce response
@@ -330,7 +325,6 @@ class UDPTrackerServer:
                 
                 # Create scrape event
                 scrape_event = AnnounceEvent(
-                    timestamp=datetime.now(),
                     info_hash=info_hash_hex,
                     info_hash_hex=info_hash_hex,
                     peer_id="",
@@ -347,9 +341,8 @@ class UDPTrackerServer:
                     raw_query=f"UDP scrape from {addr[0]}:{addr[1]}"
                 )
                 
-                # Store in database
-                event_id = self.db.insert_announce(scrape_event)
-                scrape_event.id = event_id
+                # Queue for the background database writer
+                scrape_event.id = self.db.queue_announce(scrape_event)
                 
                 # Broadcast event if callback provided
                 if self.event_callback:
@@ -359,12 +352,13 @@ class UDPTrackerServer:
                         logger.error(f"Error in scrape event callback: {e}")
             
             # Log the scrape
-            logger.info(
-                f"UDP Scrape: {num_hashes} hash(es) | "
-                f"Client: {addr[0]}:{addr[1]} | "
-                f"Hashes: {', '.join(h[:8] + '...' for h in scraped_hashes[:3])}"
-                f"{'...' if num_hashes > 3 else ''}"
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "UDP Scrape: %d hash(es) | Client: %s:%d | Hashes: %s%s",
+                    num_hashes, addr[0], addr[1],
+                    ', '.join(h[:8] + '...' for h in scraped_hashes[:3]),
+                    '...' if num_hashes > 3 else ''
+                )
             
             # Return minimal scrape response
             # Format: action (2) | transaction_id | (seeders | completed | leechers) per hash
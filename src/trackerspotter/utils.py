@@ -2,10 +2,22 @@
 Utility functions for TrackerSpotter
 """
 
+import errno
 import bencodepy
 from typing import Dict, Any
 from urllib.parse import unquote_to_bytes
 
+try:
+    # Optional C implementation, used for encoding responses when available
+    import better_bencode
+    BETTER_BENCODE_AVAILABLE = True
+except ImportError:
+    BETTER_BENCODE_AVAILABLE = False
+
+# OSError.errno values for failed binds; Windows sockets report WSA codes
+ADDRESS_IN_USE_ERRNOS = frozenset({errno.EADDRINUSE, getattr(errno, 'WSAEADDRINUSE', errno.EADDRINUSE)})
+PERMISSION_DENIED_ERRNOS = frozenset({errno.EACCES, getattr(errno, 'WSAEACCES', errno.EACCES)})
+
 
 def bencode(data: Any) -> bytes:
     """
@@ -17,6 +29,8 @@ def bencode(data: Any) -> bytes:
     Returns:
         Bencoded bytes
     """
+    if BETTER_BENCODE_AVAILABLE:
+        return better_bencode.dumps(data)
     return bencodepy.encode(data)
 
 